@@ -2,6 +2,7 @@
 
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied
 from django.conf import settings
 import jwt
 from jwt import PyJWKClient
@@ -30,8 +31,16 @@ class EmailBackend(ModelBackend):
                 print("--- EmailBackend: No user found with that email or username. ---")
                 return None
 
-        # If a user is found, check their password and ensure they are active
-        if user.check_password(password) and self.user_can_authenticate(user):
+        # Disabled accounts can never log in: stop the backend chain here rather than
+        # checking the password (once here and again in ModelBackend) only to reject it.
+        # Hash once anyway, like ModelBackend does for unknown users, so the response
+        # time doesn't reveal that the account exists but is disabled
+        if not self.user_can_authenticate(user):
+            UserModel().set_password(password)
+            raise PermissionDenied
+
+        # If a user is found, check their password
+        if user.check_password(password):
             print("--- EmailBackend: Authentication SUCCESS. ---")
             return user
         print("--- EmailBackend: Password mismatch or user not allowed to authenticate. ---")
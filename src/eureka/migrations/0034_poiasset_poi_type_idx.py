@@ -0,0 +1,33 @@
+# Generated by hand on 2026-10-16
+# Index POIAsset.type per POI for case-insensitive prefix matching
+
+from django.db import migrations, models
+from django.contrib.postgres.indexes import OpClass
+from django.db.models.functions import Upper
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eureka', '0033_poi_thumbnail_project_cover_photo_project_logo_and_more'),
+    ]
+
+    operations = [
+        # The schema editor renders an OpClass next to a plain column as
+        # ("poi_id", (UPPER("type") text_pattern_ops)), which Postgres rejects,
+        # so the index is created with explicit SQL and only recorded in the state
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql='CREATE INDEX "eureka_poiasset_poi_type_idx" ON "eureka_poiasset" ("poi_id", (UPPER("type")) text_pattern_ops);',
+                    reverse_sql='DROP INDEX IF EXISTS "eureka_poiasset_poi_type_idx";',
+                ),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='poiasset',
+                    index=models.Index(models.F('poi'), OpClass(Upper('type'), name='text_pattern_ops'), name='eureka_poiasset_poi_type_idx'),
+                ),
+            ],
+        ),
+    ]
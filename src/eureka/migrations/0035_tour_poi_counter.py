@@ -0,0 +1,32 @@
+# Generated by hand on 2026-10-16
+# Add Tour.poi_counter used to hand out POI orders without locking the tour
+
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def initialize_poi_counters(apps, schema_editor):
+    """
+    Seed each tour's poi_counter with the highest order of its existing POIs.
+    """
+    Tour = apps.get_model('eureka', 'Tour')
+    POI = apps.get_model('eureka', 'POI')
+    max_order = POI.objects.filter(tour=OuterRef('pk')).values('tour').annotate(max_order=Max('order')).values('max_order')
+    Tour.objects.update(poi_counter=Coalesce(Subquery(max_order), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eureka', '0034_poiasset_poi_type_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tour',
+            name='poi_counter',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(initialize_poi_counters, migrations.RunPython.noop),
+    ]
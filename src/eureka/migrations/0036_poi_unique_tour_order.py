@@ -0,0 +1,56 @@
+# Generated by hand on 2026-10-16
+# Make POI orders unique per tour, renumbering any existing duplicates first
+
+from django.db import migrations, models
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+
+
+def renumber_duplicate_poi_orders(apps, schema_editor):
+    """
+    Give the POIs of every tour that has duplicate orders a dense 1..N sequence,
+    keeping their current relative order (ties broken by id).
+    """
+    POI = apps.get_model('eureka', 'POI')
+    tour_ids = set(
+        POI.objects.values('tour_id', 'order')
+        .annotate(poi_count=Count('id'))
+        .filter(poi_count__gt=1)
+        .values_list('tour_id', flat=True)
+    )
+    if not tour_ids:
+        return
+
+    pois = POI.objects.filter(tour_id__in=tour_ids).annotate(
+        dense_order=Window(
+            RowNumber(),
+            partition_by=[F('tour_id')],
+            order_by=[F('order').asc(), F('id').asc()],
+        )
+    )
+    changed = []
+    for poi in pois:
+        if poi.order != poi.dense_order:
+            poi.order = poi.dense_order
+            changed.append(poi)
+    POI.objects.bulk_update(changed, ['order'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eureka', '0035_tour_poi_counter'),
+    ]
+
+    operations = [
+        migrations.RunPython(renumber_duplicate_poi_orders, migrations.RunPython.noop),
+        # The unique constraint's index also covers (tour, order) lookups
+        migrations.AddConstraint(
+            model_name='poi',
+            constraint=models.UniqueConstraint(
+                fields=['tour', 'order'],
+                name='eureka_poi_unique_tour_order',
+                deferrable=models.Deferrable.DEFERRED,
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by hand on 2026-10-16
+# Store per-kind asset counts on POI instead of counting them on every read
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+MEDIA_STAT_TYPE_PREFIXES = {
+    'image': 'image',
+    'video': 'video',
+    'audio': 'audio',
+    'model3d': 'model',
+    'text': 'text',
+}
+
+
+def backfill_poi_media_stats(apps, schema_editor):
+    """
+    Count the existing assets of every POI per media kind.
+    """
+    POI = apps.get_model('eureka', 'POI')
+    POIAsset = apps.get_model('eureka', 'POIAsset')
+    counts = {}
+    for key, prefix in MEDIA_STAT_TYPE_PREFIXES.items():
+        asset_count = POIAsset.objects.filter(
+            poi=OuterRef('pk'), type__istartswith=prefix
+        ).order_by().values('poi').annotate(n=Count('pk')).values('n')
+        counts[f'stat_{key}'] = Coalesce(Subquery(asset_count), 0)
+    POI.objects.update(**counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eureka', '0036_poi_unique_tour_order'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='poi',
+            name='stat_image',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='poi',
+            name='stat_video',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='poi',
+            name='stat_audio',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='poi',
+            name='stat_model3d',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='poi',
+            name='stat_text',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_poi_media_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by hand on 2026-10-16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eureka', '0037_poi_media_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tour',
+            index=models.Index(condition=models.Q(is_public=True), fields=['project'], name='eureka_tour_project_public_idx'),
+        ),
+    ]
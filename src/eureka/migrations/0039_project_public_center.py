@@ -0,0 +1,44 @@
+# Generated by hand on 2026-10-16
+# Store the mean public tour center on Project instead of computing it on every read
+
+from django.db import migrations, models
+from django.db.models import Avg, FloatField, OuterRef, Subquery
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
+
+
+def backfill_project_public_center(apps, schema_editor):
+    """
+    Average the centers of every project's public tours.
+    """
+    Project = apps.get_model('eureka', 'Project')
+    Tour = apps.get_model('eureka', 'Tour')
+    centers = Tour.objects.filter(project=OuterRef('pk'), is_public=True).annotate(
+        center_lat=Cast(KT('center__lat'), FloatField()),
+        center_long=Cast(KT('center__long'), FloatField()),
+    ).filter(center_lat__isnull=False, center_long__isnull=False).order_by().values('project')
+    Project.objects.update(
+        public_center_lat=Subquery(centers.annotate(v=Avg('center_lat')).values('v')),
+        public_center_long=Subquery(centers.annotate(v=Avg('center_long')).values('v')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eureka', '0038_tour_project_public_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='public_center_lat',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='public_center_long',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_project_public_center, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,47 @@
 from django.db import models
+from django.db.models.functions import Coalesce
 from .tour import Tour
 from .fields import MultilingualTextField, Coordinates, ExternalLinks
 import json
 
+# Media stat key -> POI asset type prefix it counts (matched case-insensitively)
+MEDIA_STAT_TYPE_PREFIXES = {
+    'image': 'image',
+    'video': 'video',
+    'audio': 'audio',
+    'model3d': 'model',
+    'text': 'text',
+}
+MEDIA_STAT_FIELDS = tuple(f'stat_{key}' for key in MEDIA_STAT_TYPE_PREFIXES)
+
+
+class POIQuerySet(models.QuerySet):
+    def in_groups(self, group_ids):
+        """
+        Restrict to POIs whose tour belongs to a project of one of the given groups.
+
+        Uses an EXISTS semi-join on the tour instead of joining tour and project
+        into the outer query, so Postgres can stop at the first matching tour.
+        """
+        return self.filter(models.Exists(
+            Tour.objects.filter(pk=models.OuterRef('tour_id'), project__group_id__in=group_ids)
+        ))
+
+    def refresh_media_stats(self):
+        """
+        Recompute the denormalized stat_* counters of these POIs from their
+        assets in a single UPDATE.
+        """
+        POIAsset = self.model._meta.get_field('assets').related_model
+        counts = {}
+        for key, prefix in MEDIA_STAT_TYPE_PREFIXES.items():
+            asset_count = POIAsset.objects.filter(
+                poi=models.OuterRef('pk'), type__istartswith=prefix
+            ).order_by().values('poi').annotate(n=models.Count('pk')).values('n')
+            counts[f'stat_{key}'] = Coalesce(models.Subquery(asset_count), 0)
+        return self.update(**counts)
+
+
 class POI(models.Model):
     tour = models.ForeignKey(Tour, on_delete=models.CASCADE, related_name='pois')
     title = MultilingualTextField()
@@ -19,9 +58,45 @@ class POI(models.Model):
     thumbnail = models.ForeignKey('Image', on_delete=models.SET_NULL, null=True, blank=True, related_name='poi_thumbnails')
 
     order = models.PositiveIntegerField()
+
+    # Per-kind asset counts, kept up to date by the POIAsset signals
+    stat_image = models.PositiveIntegerField(default=0, editable=False)
+    stat_video = models.PositiveIntegerField(default=0, editable=False)
+    stat_audio = models.PositiveIntegerField(default=0, editable=False)
+    stat_model3d = models.PositiveIntegerField(default=0, editable=False)
+    stat_text = models.PositiveIntegerField(default=0, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = POIQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            # Deferred so renumbering (delete, reorder) may pass through
+            # transient duplicates within a transaction
+            models.UniqueConstraint(
+                fields=['tour', 'order'],
+                name='eureka_poi_unique_tour_order',
+                deferrable=models.Deferrable.DEFERRED,
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # The stat counters are maintained with UPDATEs by the POIAsset signals;
+        # never write a possibly stale in-memory copy back on a regular update
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in MEDIA_STAT_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    @property
+    def media_stats(self):
+        """Asset counts per media kind, as rendered by the serializers."""
+        return {key: getattr(self, f'stat_{key}') for key in MEDIA_STAT_TYPE_PREFIXES}
+
     def __str__(self):
         return json.dumps({
             "id": self.id,
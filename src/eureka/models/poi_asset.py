@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from .poi import POI
 from .asset import Asset
 from .fields import MultilingualTextField, Georeference, LinkedAsset, ModelTransform, is_valid_georeference
@@ -44,6 +46,18 @@ class POIAsset(models.Model):
         'scale': {'x': 1.0, 'y': 1.0, 'z': 1.0},
     }
 
+    class Meta:
+        indexes = [
+            # Supports the per-POI media stats, which filter on a case-insensitive type prefix
+            # (UPPER(type) LIKE 'IMAGE%'); text_pattern_ops makes the prefix match index-friendly.
+            # Migration 0034 creates it with explicit SQL; keep this definition in step with it.
+            models.Index(
+                models.F('poi'),
+                OpClass(Upper('type'), name='text_pattern_ops'),
+                name='eureka_poiasset_poi_type_idx',
+            ),
+        ]
+
     def save(self, *args, **kwargs):
         if self.model_transform is None:
             self.model_transform = self.DEFAULT_MODEL_TRANSFORM
@@ -1,8 +1,110 @@
+from math import cos, radians
+
 from django.db import models
 from django.contrib.auth.models import Group
 from django.conf import settings
+from django.db.models.fields.json import KT
+from django.db.models.functions import ASin, Cast, Coalesce, Cos, Least, Power, Radians, Sin, Sqrt
 from .fields import MultilingualTextField
 
+# Radius of earth in kilometers
+EARTH_RADIUS_KM = 6371
+
+PUBLIC_CENTER_FIELDS = ('public_center_lat', 'public_center_long')
+
+
+class ProjectQuerySet(models.QuerySet):
+    def with_public_tours(self):
+        """
+        Keep only projects that have at least one public tour.
+
+        Uses an EXISTS subquery rather than a join, so projects are never
+        duplicated and no DISTINCT is needed.
+        """
+        Tour = self.model._meta.get_field('tours').related_model
+        return self.filter(models.Exists(Tour.objects.filter(project=models.OuterRef('pk'), is_public=True)))
+
+    def with_stats(self, public_only=False):
+        """
+        Annotate each project with total_tours and total_pois.
+
+        Each count is a correlated subquery over a single table (tours by project,
+        POIs by their tour's project), so rows are never multiplied by joining
+        tours and POIs together and no COUNT(DISTINCT ...) is needed.
+
+        Args:
+            public_only: If True, only count public tours and the POIs of public tours.
+        """
+        Tour = self.model._meta.get_field('tours').related_model
+        POI = Tour._meta.get_field('pois').related_model
+        tours = Tour.objects.filter(project=models.OuterRef('pk'))
+        pois = POI.objects.filter(tour__project=models.OuterRef('pk'))
+        if public_only:
+            tours = tours.filter(is_public=True)
+            pois = pois.filter(tour__is_public=True)
+        tour_count = tours.order_by().values('project').annotate(n=models.Count('pk')).values('n')
+        poi_count = pois.order_by().values('tour__project').annotate(n=models.Count('pk')).values('n')
+        return self.annotate(
+            total_tours=Coalesce(models.Subquery(tour_count), 0),
+            total_pois=Coalesce(models.Subquery(poi_count), 0),
+        )
+
+    def _tour_center_subqueries(self, public_only=False):
+        """
+        Return (lat, long) subqueries averaging the centers of each project's
+        tours (only public ones if public_only), skipping tours without a center.
+        """
+        Tour = self.model._meta.get_field('tours').related_model
+        tours = Tour.objects.filter(project=models.OuterRef('pk'))
+        if public_only:
+            tours = tours.filter(is_public=True)
+        centers = tours.annotate(
+            center_lat=Cast(KT('center__lat'), models.FloatField()),
+            center_long=Cast(KT('center__long'), models.FloatField()),
+        ).filter(center_lat__isnull=False, center_long__isnull=False).order_by().values('project')
+        return (
+            models.Subquery(centers.annotate(v=models.Avg('center_lat')).values('v')),
+            models.Subquery(centers.annotate(v=models.Avg('center_long')).values('v')),
+        )
+
+    def with_center(self):
+        """
+        Annotate each project with center_lat and center_long, the same center
+        get_center() computes, so listing projects doesn't query tours per project.
+        """
+        center_lat, center_long = self._tour_center_subqueries()
+        return self.annotate(center_lat=center_lat, center_long=center_long)
+
+    def refresh_public_center(self):
+        """
+        Recompute the denormalized public_center_lat/public_center_long of these
+        projects in a single UPDATE: the mean of their public tours' centers, or
+        NULL when no public tour has a center.
+        """
+        center_lat, center_long = self._tour_center_subqueries(public_only=True)
+        return self.update(public_center_lat=center_lat, public_center_long=center_long)
+
+    def order_by_distance(self, lat, long):
+        """
+        Order projects by great circle distance in kilometers (Haversine formula)
+        from the given point to their public center, nearest first.
+
+        The distance is computed in the database and annotated as `distance`;
+        projects without a public center come last.
+        """
+        origin_lat, origin_long = radians(lat), radians(long)
+        center_lat = Radians(models.F('public_center_lat'))
+        center_long = Radians(models.F('public_center_long'))
+        a = (
+            Power(Sin((center_lat - origin_lat) / 2.0), 2)
+            + cos(origin_lat) * Cos(center_lat) * Power(Sin((center_long - origin_long) / 2.0), 2)
+        )
+        return self.annotate(
+            # Clamp against rounding past 1 for near-antipodal points
+            distance=2.0 * EARTH_RADIUS_KM * ASin(Least(Sqrt(a), 1.0)),
+        ).order_by(models.F('distance').asc(nulls_last=True), '-id')
+
+
 class Project(models.Model):
     """
     Project model - represents a collection of tours and assets.
@@ -18,9 +120,25 @@ class Project(models.Model):
     logo = models.ForeignKey('Image', on_delete=models.SET_NULL, null=True, blank=True, related_name='project_logos')
     cover_photo = models.ForeignKey('Image', on_delete=models.SET_NULL, null=True, blank=True, related_name='project_covers')
 
+    # Mean center of the public tours, maintained by refresh_public_center() from the Tour signals
+    public_center_lat = models.FloatField(null=True, blank=True, editable=False)
+    public_center_long = models.FloatField(null=True, blank=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProjectQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        # The public center is maintained with UPDATEs by the Tour signals;
+        # never write a possibly stale in-memory copy back on a regular update
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in PUBLIC_CENTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Project: {self.title} (Group: {self.group.name})"
 
@@ -33,7 +151,13 @@ class Project(models.Model):
 
         Returns None if no tours have centers.
         """
-        tours = self.tours.filter(is_public=True) if public_only else self.tours.all()
+        if public_only:
+            # Read the denormalized public center instead of querying the tours
+            if self.public_center_lat is None or self.public_center_long is None:
+                return None
+            return {"lat": self.public_center_lat, "long": self.public_center_long}
+
+        tours = self.tours.all()
         if not tours.exists():
             return None
 
@@ -1,8 +1,31 @@
 from django.db import models
+from django.db.models.functions import Coalesce, Greatest
 from .project import Project
 from .fields import MultilingualTextField, BoundingBox, Coordinates
 import json
 
+class TourQuerySet(models.QuerySet):
+    def with_stats(self):
+        """
+        Annotate each tour with total_pois and total_assets.
+
+        Each count is a correlated subquery grouped by the tour id, so POIs and
+        their assets are never joined together and no COUNT(DISTINCT ...) is needed.
+        """
+        POI = self.model._meta.get_field('pois').related_model
+        POIAsset = POI._meta.get_field('assets').related_model
+        poi_count = POI.objects.filter(tour=models.OuterRef('pk')).order_by().values('tour').annotate(
+            n=models.Count('pk')
+        ).values('n')
+        asset_count = POIAsset.objects.filter(poi__tour=models.OuterRef('pk')).order_by().values('poi__tour').annotate(
+            n=models.Count('pk')
+        ).values('n')
+        return self.annotate(
+            total_pois=Coalesce(models.Subquery(poi_count), 0),
+            total_assets=Coalesce(models.Subquery(asset_count), 0),
+        )
+
+
 class Tour(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='tours')
     title = MultilingualTextField()
@@ -19,12 +42,23 @@ class Tour(models.Model):
     locales = models.JSONField(default=list, help_text="Supported language codes for this tour, e.g. ['en', 'fr', 'it']")
     guided = models.BooleanField(default=False, help_text="Whether this tour is guided")
 
+    # Highest POI order handed out so far, bumped atomically by next_poi_order()
+    poi_counter = models.PositiveIntegerField(default=0, editable=False)
+
     # Cover photo
     cover_photo = models.ForeignKey('Image', on_delete=models.SET_NULL, null=True, blank=True, related_name='tour_covers')
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TourQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Partial index for public tour lookups by project (public_only prefetch, public views)
+            models.Index(fields=['project'], condition=models.Q(is_public=True), name='eureka_tour_project_public_idx'),
+        ]
+
     def update_bounding_box(self):
         """
         Calculate and update the tour's bounding box and center based on all POIs in the tour using their coordinates.
@@ -34,7 +68,7 @@ class Tour(models.Model):
             # No POIs, clear the bounding box and center
             self.bounding_box = None
             self.center = None
-            self.save()
+            self.save(update_fields=['bounding_box', 'center', 'updated_at'])
             return
 
         # Collect all valid coordinates from POIs
@@ -81,7 +115,37 @@ class Tour(models.Model):
             self.bounding_box = None
             self.center = None
 
-        self.save()
+        # Only write the computed fields so a stale in-memory poi_counter is never saved back
+        self.save(update_fields=['bounding_box', 'center', 'updated_at'])
+
+    def _max_poi_order(self):
+        """Expression for the highest POI order in the tour being updated, or 0 when it has none."""
+        POI = self.pois.model  # type: ignore[attr-defined]
+        max_order = POI.objects.filter(tour=models.OuterRef('pk')).order_by().values('tour').annotate(
+            m=models.Max('order')
+        ).values('m')
+        return Coalesce(models.Subquery(max_order), 0)
+
+    def next_poi_order(self):
+        """
+        Reserve and return the order value for a new POI in this tour.
+
+        Call it in the same transaction as the POI insert: the UPDATE's row lock
+        serializes concurrent creations until commit, and a failed insert rolls the
+        reservation back. The counter never falls below the current MAX(order), so
+        POIs created outside the API still get a fresh order.
+        """
+        tours = Tour.objects.filter(pk=self.pk)
+        tours.update(poi_counter=Greatest(models.F('poi_counter'), self._max_poi_order()) + 1)
+        self.poi_counter = tours.values_list('poi_counter', flat=True).get()
+        return self.poi_counter
+
+    def resync_poi_counter(self):
+        """
+        Reset poi_counter to the tour's current MAX(order) after POIs were deleted
+        or renumbered, so the next POI is appended right after the last one.
+        """
+        Tour.objects.filter(pk=self.pk).update(poi_counter=self._max_poi_order())
 
     def __str__(self):
         return json.dumps({
@@ -0,0 +1,14 @@
+from rest_framework.pagination import LimitOffsetPagination
+
+
+class OptionalLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination that only kicks in when the client asks for it.
+
+    Without a `limit` query parameter the full list is returned as a plain
+    array, so existing clients keep working. With `?limit=N&offset=M` the
+    response is the standard paginated envelope (count/next/previous/results),
+    and `limit` is capped at `max_limit`.
+    """
+    default_limit = None
+    max_limit = 500
@@ -19,6 +19,37 @@ class ReadOnlyPublicAccess(permissions.BasePermission):
         # For unsafe methods, require authentication
         return request.user and request.user.is_authenticated
 
+def get_user_group_ids(request):
+    """
+    Return the set of group ids the requesting user belongs to.
+
+    The ids are fetched with a single query the first time they are needed
+    and cached on the request, so permission checks and queryset filters
+    share the same result instead of re-querying auth_user_groups.
+    """
+    group_ids = getattr(request, '_user_group_ids', None)
+    if group_ids is None:
+        user = request.user
+        if user and user.is_authenticated:
+            group_ids = set(user.groups.values_list('id', flat=True))
+        else:
+            group_ids = set()
+        request._user_group_ids = group_ids
+    return group_ids
+
+class InProjectGroup(permissions.BasePermission):
+    """
+    Permission that requires authentication and loads the user's group ids once per request.
+
+    Views using it can filter their querysets with `get_user_group_ids(request)`
+    (e.g. `project__group_id__in=...`) without another membership query.
+    """
+    def has_permission(self, request, view):
+        if not (request.user and request.user.is_authenticated):
+            return False
+        get_user_group_ids(request)
+        return True
+
 class IsGroupMember(permissions.BasePermission):
     """
     Custom permission to only allow members of a group to access/modify objects.
@@ -31,29 +62,30 @@ class IsGroupMember(permissions.BasePermission):
         return request.user.is_authenticated
 
     def has_object_permission(self, request, view, obj):
-        # Check if the requesting user is a member of the group
-        # Handle different object types
+        # Check if the requesting user is a member of the group, using the group ids
+        # cached on the request; the *_id checks avoid loading related rows just to
+        # find out which kind of object this is
+        group_ids = get_user_group_ids(request)
 
         if isinstance(obj, Group):
             # 'obj' is a Group instance itself
-            return obj.user_set.filter(pk=request.user.pk).exists()
+            return obj.pk in group_ids
 
         # For objects with a 'group' attribute (like Project)
-        if hasattr(obj, 'group'):
-            return obj.group.user_set.filter(pk=request.user.pk).exists()
+        if hasattr(obj, 'group_id'):
+            return obj.group_id in group_ids
 
         # For objects with a 'project' attribute (like Tour)
-        if hasattr(obj, 'project'):
-            return obj.project.group.user_set.filter(pk=request.user.pk).exists()
+        if hasattr(obj, 'project_id'):
+            return obj.project.group_id in group_ids
 
         # For objects with a 'tour' attribute (like POI)
-        if hasattr(obj, 'tour') and hasattr(obj.tour, 'project'):
-            return obj.tour.project.group.user_set.filter(pk=request.user.pk).exists()
+        if hasattr(obj, 'tour_id'):
+            return obj.tour.project.group_id in group_ids
 
         # For objects with a 'poi' attribute (like POIAsset)
-        if hasattr(obj, 'poi') and hasattr(obj.poi, 'tour') and hasattr(obj.poi.tour, 'project'):
-            return obj.poi.tour.project.group.user_set.filter(pk=request.user.pk).exists()
+        if hasattr(obj, 'poi_id'):
+            return obj.poi.tour.project.group_id in group_ids
 
         # If none of the above, deny permission
         return False
-    
\ No newline at end of file
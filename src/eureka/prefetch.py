@@ -0,0 +1,15 @@
+from django.db.models import Prefetch, prefetch_related_objects
+
+
+def prefetch_empty(instance, *relations):
+    """
+    Mark reverse relations of a freshly inserted instance as prefetched and empty.
+
+    A new row can't have children yet, so serializing it shouldn't query for them.
+    Each relation is prefetched from a `.none()` queryset, which Django resolves
+    without touching the database.
+    """
+    prefetch_related_objects([instance], *(
+        Prefetch(relation, queryset=instance._meta.get_field(relation).related_model.objects.none())
+        for relation in relations
+    ))
@@ -0,0 +1,25 @@
+import copy
+from rest_framework import serializers
+
+# Field maps built by CachedFieldsModelSerializer, keyed by serializer class
+_FIELDS_CACHE = {}
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its field map once per serializer class.
+
+    ModelSerializer.get_fields() introspects the model and builds every field
+    on each instantiation, although the result only depends on the class (Meta
+    and declared fields). The map is built once and each instance receives a
+    deep copy, since fields are bound to the serializer that owns them. DRF
+    copies a field by re-instantiating it from its constructor arguments,
+    which is far cheaper than the model introspection.
+    """
+
+    def get_fields(self):
+        serializer_class = type(self)
+        fields = _FIELDS_CACHE.get(serializer_class)
+        if fields is None:
+            fields = _FIELDS_CACHE[serializer_class] = super().get_fields()
+        return copy.deepcopy(fields)
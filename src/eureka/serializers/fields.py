@@ -159,14 +159,14 @@ class ExternalLinks(serializers.JSONField):
         # Return full multilingual object
         return data
 
-@extend_schema_field({'ref': '#/components/schemas/MultilingualText'})
+@extend_schema_field({'$ref': '#/components/schemas/MultilingualText'})
 class MultilingualTextField(serializers.JSONField):
     """
     A custom serializer field for multilingual text content, which is
     represented as a JSON object with language codes as keys.
 
     In the OpenAPI schema, this field is represented by a reference to the
-    reusable 'MultilingualText' component defined in SPECTACULAR_SETTINGS.
+    reusable 'MultilingualText' component appended by SPECTACULAR_SETTINGS.
 
     Supports locale filtering: if a 'locale' parameter is passed in the serializer context,
     the field will return just the string for that locale instead of the full multilingual object.
@@ -5,9 +5,10 @@ from ..models.project import Project
 from ..models.poi_asset import POIAsset
 from .fields import MultilingualTextField, Coordinates, Georeference, BoundingBox, ExternalLinks, LinkedAsset, ModelTransform
 from .user_serializer import UserLiteSerializer
+from .cached_serializer import CachedFieldsModelSerializer
 
 
-class POIAssetNestedSerializer(serializers.ModelSerializer):
+class POIAssetNestedSerializer(CachedFieldsModelSerializer):
     """
     Nested serializer for POIAsset used in populated project endpoint.
     Includes all asset details without related object IDs.
@@ -31,7 +32,7 @@ class POIAssetNestedSerializer(serializers.ModelSerializer):
         ]
 
 
-class POINestedSerializer(serializers.ModelSerializer):
+class POINestedSerializer(CachedFieldsModelSerializer):
     """
     Nested serializer for POI used in populated project endpoint.
     Includes all POI details and nested assets, plus calculated stats.
@@ -43,7 +44,7 @@ class POINestedSerializer(serializers.ModelSerializer):
     description = MultilingualTextField(required=False, allow_null=True)
     coordinates = Coordinates(required=False, allow_null=True)
     external_links = ExternalLinks(required=False, allow_null=True)
-    assets = serializers.SerializerMethodField(read_only=True)
+    assets = POIAssetNestedSerializer(many=True, read_only=True)
     stats = serializers.SerializerMethodField(read_only=True)
     thumbnail_url = serializers.SerializerMethodField(read_only=True)
 
@@ -55,59 +56,19 @@ class POINestedSerializer(serializers.ModelSerializer):
         ]
 
     def get_thumbnail_url(self, obj):
-        if not obj.thumbnail:
+        if not obj.thumbnail_id:
             return None
         request = self.context.get('request')
         if request:
-            return request.build_absolute_uri(f'/api/images/{obj.thumbnail.id}')
-        return f'/api/images/{obj.thumbnail.id}'
-
-    def get_assets(self, obj):
-        """Serialize assets with context (for locale support)"""
-        assets = obj.assets.all()
-        return POIAssetNestedSerializer(assets, many=True, context=self.context).data
+            return request.build_absolute_uri(f'/api/images/{obj.thumbnail_id}')
+        return f'/api/images/{obj.thumbnail_id}'
 
     def get_stats(self, obj):
-        """Calculate media statistics for this POI's assets"""
-        # Check if stats were already annotated by the viewset for performance
-        if hasattr(obj, 'stat_image') and hasattr(obj, 'stat_video') and \
-           hasattr(obj, 'stat_audio') and hasattr(obj, 'stat_model3d') and \
-           hasattr(obj, 'stat_text'):
-            return {
-                'image': obj.stat_image or 0,
-                'video': obj.stat_video or 0,
-                'audio': obj.stat_audio or 0,
-                'model3d': obj.stat_model3d or 0,
-                'text': obj.stat_text or 0,
-            }
-
-        # Fallback: calculate from prefetched assets
-        assets = obj.assets.all()
-        stats = {
-            'image': 0,
-            'video': 0,
-            'audio': 0,
-            'model3d': 0,
-            'text': 0,
-        }
-
-        for asset in assets:
-            asset_type = asset.type.lower()
-            if asset_type.startswith('image') or asset_type == 'image':
-                stats['image'] += 1
-            elif asset_type.startswith('video') or asset_type == 'video':
-                stats['video'] += 1
-            elif asset_type.startswith('audio') or asset_type == 'audio':
-                stats['audio'] += 1
-            elif asset_type.startswith('model') or asset_type == 'model3d':
-                stats['model3d'] += 1
-            elif asset_type.startswith('text') or asset_type == 'text':
-                stats['text'] += 1
-
-        return stats
-
-
-class TourNestedSerializer(serializers.ModelSerializer):
+        """Media statistics for this POI's assets, stored on the POI row"""
+        return obj.media_stats
+
+
+class TourNestedSerializer(CachedFieldsModelSerializer):
     """
     Nested serializer for Tour used in populated project endpoint.
     Includes all tour details and nested POIs, plus calculated stats.
@@ -119,7 +80,7 @@ class TourNestedSerializer(serializers.ModelSerializer):
     description = MultilingualTextField(required=False, allow_null=True)
     bounding_box = BoundingBox(required=False, allow_null=True, read_only=True)
     center = Coordinates(required=False, allow_null=True, read_only=True)
-    pois = serializers.SerializerMethodField(read_only=True)
+    pois = POINestedSerializer(many=True, read_only=True)
     total_pois = serializers.SerializerMethodField(read_only=True)
     total_assets = serializers.SerializerMethodField(read_only=True)
     cover_photo_url = serializers.SerializerMethodField(read_only=True)
@@ -133,17 +94,12 @@ class TourNestedSerializer(serializers.ModelSerializer):
         ]
 
     def get_cover_photo_url(self, obj):
-        if not obj.cover_photo:
+        if not obj.cover_photo_id:
             return None
         request = self.context.get('request')
         if request:
-            return request.build_absolute_uri(f'/api/images/{obj.cover_photo.id}')
-        return f'/api/images/{obj.cover_photo.id}'
-
-    def get_pois(self, obj):
-        """Serialize POIs with context (for locale support)"""
-        pois = obj.pois.all()
-        return POINestedSerializer(pois, many=True, context=self.context).data
+            return request.build_absolute_uri(f'/api/images/{obj.cover_photo_id}')
+        return f'/api/images/{obj.cover_photo_id}'
 
     def get_total_pois(self, obj):
         """Calculate the total number of POIs in this tour"""
@@ -159,7 +115,7 @@ class TourNestedSerializer(serializers.ModelSerializer):
         return sum(poi.assets.count() for poi in obj.pois.all())
 
 
-class ProjectPopulatedSerializer(serializers.ModelSerializer):
+class ProjectPopulatedSerializer(CachedFieldsModelSerializer):
     """
     Specialized serializer for fully populated project data.
     Includes all nested tours, POIs, and assets with calculated statistics.
@@ -172,7 +128,7 @@ class ProjectPopulatedSerializer(serializers.ModelSerializer):
     description = MultilingualTextField(required=False, allow_null=True)
     center = serializers.SerializerMethodField(read_only=True)
     created_by = UserLiteSerializer(read_only=True)
-    tours = serializers.SerializerMethodField(read_only=True)
+    tours = TourNestedSerializer(many=True, read_only=True)
     total_tours = serializers.SerializerMethodField(read_only=True)
     total_pois = serializers.SerializerMethodField(read_only=True)
     group_members = serializers.SerializerMethodField(read_only=True)
@@ -189,42 +145,38 @@ class ProjectPopulatedSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_by', 'created_at', 'updated_at', 'logo_url', 'cover_photo_url']
 
     def get_logo_url(self, obj):
-        if not obj.logo:
+        if not obj.logo_id:
             return None
         request = self.context.get('request')
         if request:
-            return request.build_absolute_uri(f'/api/images/{obj.logo.id}')
-        return f'/api/images/{obj.logo.id}'
+            return request.build_absolute_uri(f'/api/images/{obj.logo_id}')
+        return f'/api/images/{obj.logo_id}'
 
     def get_cover_photo_url(self, obj):
-        if not obj.cover_photo:
+        if not obj.cover_photo_id:
             return None
         request = self.context.get('request')
         if request:
-            return request.build_absolute_uri(f'/api/images/{obj.cover_photo.id}')
-        return f'/api/images/{obj.cover_photo.id}'
+            return request.build_absolute_uri(f'/api/images/{obj.cover_photo_id}')
+        return f'/api/images/{obj.cover_photo_id}'
 
     def get_center(self, obj):
         """Calculate the project's center using the model method"""
         return obj.get_center()
 
-    def get_tours(self, obj):
-        """Serialize tours with context (for locale support)"""
-        tours = obj.tours.all()
-        return TourNestedSerializer(tours, many=True, context=self.context).data
-
     def get_total_tours(self, obj):
         """Calculate the total number of tours in this project"""
         if hasattr(obj, 'total_tours'):
             return obj.total_tours
-        return obj.tours.count()
+        # Use prefetched tours to calculate
+        return len(obj.tours.all())
 
     def get_total_pois(self, obj):
         """Calculate the total number of POIs across all tours in this project"""
         if hasattr(obj, 'total_pois'):
             return obj.total_pois
-        # Use prefetched tours to calculate
-        return sum(tour.pois.count() for tour in obj.tours.all())
+        # Use prefetched tours and POIs to calculate
+        return sum(len(tour.pois.all()) for tour in obj.tours.all())
 
     def get_group_members(self, obj):
         """Return lightweight list of users who are members of the project's group"""
@@ -11,6 +11,7 @@ class POIAssetSerializer(serializers.ModelSerializer):
     multilingual fields (title, description, url, linked_asset) will return just the string/object for that locale.
     """
     title = MultilingualTextField(
+        required=False,
         help_text="Multilingual title with locales structure"
     )
     description = MultilingualTextField(
@@ -19,6 +20,7 @@ class POIAssetSerializer(serializers.ModelSerializer):
         help_text="Multilingual description with locales structure"
     )
     url = MultilingualTextField(
+        required=False,
         help_text="Multilingual URL with locales structure"
     )
 
@@ -40,6 +42,41 @@ class POIAssetSerializer(serializers.ModelSerializer):
         help_text="3D transform with position, rotation, and scale (optional)"
     )
 
+    # The POI a new asset is attached to; ignored on update, the association can't change
+    poi_id = serializers.IntegerField(
+        write_only=True,
+        required=False,
+        help_text="ID of the POI to create the asset for (required on create)"
+    )
+
+    # Fields that must be supplied on a full update, or when a POI asset is created
+    # without a source asset template
+    FIELDS_REQUIRED_WITHOUT_SOURCE = ('title', 'type', 'url')
+
+    def validate(self, attrs):
+        """
+        Full updates (PUT) require title/type/url. On create they are only optional
+        when a source_asset_id is provided, since they are then copied from the source
+        asset by the view. A new asset always needs the poi_id to attach to.
+        """
+        attrs = super().validate(attrs)
+        errors = {}
+        creating = self.instance is None
+        if creating and attrs.get('poi_id') is None:
+            errors['poi_id'] = 'This field is required.'
+        elif not creating:
+            attrs.pop('poi_id', None)
+        if not self.partial and not (creating and self.initial_data.get('source_asset_id')):
+            message = 'This field is required when source_asset_id is not provided.' if creating else 'This field is required.'
+            errors.update({
+                field: message
+                for field in self.FIELDS_REQUIRED_WITHOUT_SOURCE
+                if field not in attrs
+            })
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         if data.get('model_transform') is None:
@@ -55,6 +92,9 @@ class POIAssetSerializer(serializers.ModelSerializer):
     class Meta:
         model = POIAsset
         fields = [
-            'id', 'poi', 'source_asset', 'title', 'description', 'type', 'url', 'priority', 'view_in_ar', 'ar_placement', 'spawn_radius', 'georeference', 'is_georeferenced', 'linked_asset', 'model_transform', 'created_at', 'updated_at'
+            'id', 'poi', 'poi_id', 'source_asset', 'title', 'description', 'type', 'url', 'priority', 'view_in_ar', 'ar_placement', 'spawn_radius', 'georeference', 'is_georeferenced', 'linked_asset', 'model_transform', 'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at', 'is_georeferenced']
+        extra_kwargs = {
+            'type': {'required': False},
+        }
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from ..models.poi import POI
+from ..prefetch import prefetch_empty
 from ..serializers.poi_asset_serializer import POIAssetSerializer
 from .fields import MultilingualTextField, Coordinates, ExternalLinks
 
@@ -40,14 +41,26 @@ class POISerializer(serializers.ModelSerializer):
         fields = ['id', 'tour', 'title', 'description', 'coordinates', 'radius', 'external_links', 'thumbnail', 'thumbnail_url', 'order', 'stats', 'assets', 'created_at', 'updated_at']
         read_only_fields = ['tour', 'order', 'thumbnail_url', 'created_at', 'updated_at']
 
+    def create(self, validated_data):
+        """
+        Insert the POI directly and pre-populate its (empty) assets,
+        so serializing the create response issues no further queries.
+        """
+        instance = POI(**validated_data)
+        instance.save(force_insert=True)
+
+        # A brand-new POI cannot have assets yet
+        prefetch_empty(instance, 'assets')
+        return instance
+
     def get_thumbnail_url(self, obj):
         """Generate the public URL for the thumbnail image if it exists."""
-        if not obj.thumbnail:
+        if not obj.thumbnail_id:
             return None
         request = self.context.get('request')
         if request:
-            return request.build_absolute_uri(f'/api/images/{obj.thumbnail.id}')
-        return f'/api/images/{obj.thumbnail.id}'
+            return request.build_absolute_uri(f'/api/images/{obj.thumbnail_id}')
+        return f'/api/images/{obj.thumbnail_id}'
 
     def get_assets(self, obj):
         """Serialize assets with context (for locale support)"""
@@ -55,39 +68,5 @@ class POISerializer(serializers.ModelSerializer):
         return POIAssetSerializer(assets, many=True, context=self.context).data
 
     def get_stats(self, obj):
-        """Calculate media statistics for this POI's assets"""
-        # Check if stats were already annotated by the viewset for performance
-        if hasattr(obj, 'stat_image') and hasattr(obj, 'stat_video') and hasattr(obj, 'stat_audio') and hasattr(obj, 'stat_model3d') and hasattr(obj, 'stat_text'):
-            return {
-                'image': obj.stat_image or 0,
-                'video': obj.stat_video or 0,
-                'audio': obj.stat_audio or 0,
-                'model3d': obj.stat_model3d or 0,
-                'text': obj.stat_text or 0,
-            }
-
-        # Fallback: calculate from database
-        assets = obj.assets.all()
-        stats = {
-            'image': 0,
-            'video': 0,
-            'audio': 0,
-            'model3d': 0,
-            'text': 0,
-        }
-
-        for asset in assets:
-            asset_type = asset.type.lower()
-            # Map asset types to stats categories
-            if asset_type.startswith('image') or asset_type == 'image':
-                stats['image'] += 1
-            elif asset_type.startswith('video') or asset_type == 'video':
-                stats['video'] += 1
-            elif asset_type.startswith('audio') or asset_type == 'audio':
-                stats['audio'] += 1
-            elif asset_type.startswith('model') or asset_type == 'model3d':
-                stats['model3d'] += 1
-            elif asset_type.startswith('text') or asset_type == 'text':
-                stats['text'] += 1
-
-        return stats
+        """Media statistics for this POI's assets, stored on the POI row"""
+        return obj.media_stats
@@ -4,8 +4,9 @@ from ..models.poi import POI
 from .tour_serializer import TourSerializerLite
 from .user_serializer import UserLiteSerializer
 from .fields import MultilingualTextField
+from .cached_serializer import CachedFieldsModelSerializer
 
-class ProjectStatsBaseSerializer(serializers.ModelSerializer):
+class ProjectStatsBaseSerializer(CachedFieldsModelSerializer):
     title = MultilingualTextField()
     description = MultilingualTextField(required=False, allow_null=True)
     center = serializers.SerializerMethodField(read_only=True)
@@ -23,24 +24,29 @@ class ProjectStatsBaseSerializer(serializers.ModelSerializer):
 
     def get_logo_url(self, obj):
         """Generate the public URL for the logo image if it exists."""
-        if not obj.logo:
+        if not obj.logo_id:
             return None
         request = self.context.get('request')
         if request:
-            return request.build_absolute_uri(f'/api/images/{obj.logo.id}')
-        return f'/api/images/{obj.logo.id}'
+            return request.build_absolute_uri(f'/api/images/{obj.logo_id}')
+        return f'/api/images/{obj.logo_id}'
 
     def get_cover_photo_url(self, obj):
         """Generate the public URL for the cover photo if it exists."""
-        if not obj.cover_photo:
+        if not obj.cover_photo_id:
             return None
         request = self.context.get('request')
         if request:
-            return request.build_absolute_uri(f'/api/images/{obj.cover_photo.id}')
-        return f'/api/images/{obj.cover_photo.id}'
+            return request.build_absolute_uri(f'/api/images/{obj.cover_photo_id}')
+        return f'/api/images/{obj.cover_photo_id}'
 
     def get_center(self, obj):
         """Calculate the project's center using the model method"""
+        # List querysets annotate the center with with_center()
+        if hasattr(obj, 'center_lat'):
+            if obj.center_lat is None:
+                return None
+            return {'lat': obj.center_lat, 'long': obj.center_long}
         return obj.get_center()
 
     def get_total_tours(self, obj):
@@ -1,4 +1,7 @@
+from operator import attrgetter
+
 from rest_framework import serializers
+from django.db import transaction
 from ..models.tour import Tour
 from ..models.poi import POI
 from ..models.poi_asset import POIAsset
@@ -27,12 +30,12 @@ class TourStatsBaseSerializer(serializers.ModelSerializer):
 
     def get_cover_photo_url(self, obj):
         """Generate the public URL for the cover photo if it exists."""
-        if not obj.cover_photo:
+        if not obj.cover_photo_id:
             return None
         request = self.context.get('request')
         if request:
-            return request.build_absolute_uri(f'/api/images/{obj.cover_photo.id}')
-        return f'/api/images/{obj.cover_photo.id}'
+            return request.build_absolute_uri(f'/api/images/{obj.cover_photo_id}')
+        return f'/api/images/{obj.cover_photo_id}'
 
     def get_total_pois(self, obj):
         if hasattr(obj, 'total_pois'):
@@ -79,9 +82,11 @@ class TourSerializer(TourStatsBaseSerializer):
         while accepting POI IDs when writing.
         """
         representation = super().to_representation(instance)
-        # Add the full POI objects for reading
+        # Add the full POI objects for reading; sort in Python so POIs that were
+        # prefetched (or prefetched empty) are reused instead of queried again
+        pois = sorted(instance.pois.all(), key=attrgetter('order'))
         representation['pois'] = POISerializer(
-            instance.pois.all().order_by('order'),
+            pois,
             many=True,
             context=self.context
         ).data
@@ -141,8 +146,11 @@ class TourSerializer(TourStatsBaseSerializer):
                     'pois': 'Duplicate POI IDs are not allowed in the reordering array.'
                 })
 
-            # Update the order of each POI based on its index
-            for index, poi_id in enumerate(poi_ids):
-                POI.objects.filter(id=poi_id, tour=instance).update(order=index)
+            # Update the order of each POI based on its index; one transaction so the
+            # deferred (tour, order) uniqueness check only sees the final orders
+            with transaction.atomic():
+                for index, poi_id in enumerate(poi_ids):
+                    POI.objects.filter(id=poi_id, tour=instance).update(order=index)
+                instance.resync_poi_counter()
 
         return instance
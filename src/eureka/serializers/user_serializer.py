@@ -2,6 +2,7 @@ from rest_framework import serializers
 from rest_framework.authtoken.models import Token # For login response
 from django.contrib.auth import authenticate # For authenticating users
 from ..models.user import User # Your custom User model
+from .cached_serializer import CachedFieldsModelSerializer
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -75,7 +76,7 @@ class SignupSerializer(serializers.ModelSerializer):
         # So we don't need to create it here anymore
         return user
 
-class CurrentUserSerializer(serializers.ModelSerializer):
+class CurrentUserSerializer(CachedFieldsModelSerializer):
     """
     Serializer for the currently authenticated user's details.
     Supports PATCH for name and username only; email is read-only.
@@ -98,7 +98,9 @@ if not DATABASE_URL:
 DATABASES = {
     'default': dj_database_url.config(
         default=DATABASE_URL,
-        conn_max_age=600
+        conn_max_age=600,
+        # Check persistent connections before reuse so a dropped one doesn't fail a request
+        conn_health_checks=True,
     )
 }
 
@@ -123,6 +125,14 @@ AUTH_PASSWORD_VALIDATORS = [ ]
 },
 """
 
+# Argon2id first; the PBKDF2 entries keep existing password hashes valid, and
+# they are upgraded to Argon2 on the user's next successful login
+PASSWORD_HASHERS = [
+    'eureka.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
 AUTHENTICATION_BACKENDS = [
     'eureka.backends.OIDCAuthenticationBackend',   # OpenID Connect authentication
     'eureka.backends.EmailBackend',                # Your custom email authentication backend
@@ -209,7 +219,12 @@ REST_FRAMEWORK = {
         'anon': '1000/hour',  # Anonymous users limited to 1000 requests per hour
         'user': '10000/hour',  # Authenticated users get higher limit
         'public_projects': '500/hour',  # Scoped throttle for public project endpoints (limit is per IP for anonymous users)
-    }
+        'login': '10/min',  # Scoped throttle for OIDC login (per IP), to shed brute-force attempts
+        'login_failure': '10/min',  # Failed password logins per submitted login and client IP
+    },
+    # Reverse proxies in front of the app (nginx in deployment): client IPs for
+    # throttling are read from X-Forwarded-For that many hops back; 0 uses REMOTE_ADDR
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', '1')),
 }
 
 SPECTACULAR_SETTINGS = {
@@ -287,7 +302,7 @@ All multilingual content is stored in JSON format, allowing for flexible languag
             'description': 'Token-based authentication. Format: Token your_token_here'
         }
     },
-    'COMPONENTS': {
+    'APPEND_COMPONENTS': {
         'schemas': {
             'MultilingualText': {
                 'type': 'object',
@@ -1,14 +1,62 @@
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from .models.project import Project
+from .models.tour import Tour
 from .models.poi import POI
+from .models.poi_asset import POIAsset
 
 @receiver([post_save, post_delete], sender=POI)
-def update_tour_bounding_box(sender, instance, **kwargs):
+def update_tour_bounding_box(sender, instance, origin=None, **kwargs):
     """
     Update the tour's bounding box and center whenever a POI is created, updated, or deleted.
     """
+    # A delete that didn't start from POIs is a cascade from the tour (or its project)
+    # being deleted; there is no bounding box left to maintain
+    if origin is not None and getattr(origin, 'model', type(origin)) is not POI:
+        return
+
     # Get the tour associated with this POI
     tour = instance.tour
 
     # Update the tour's bounding box and center
-    tour.update_bounding_box() 
\ No newline at end of file
+    tour.update_bounding_box()
+
+
+@receiver(post_delete, sender=POI)
+def resync_tour_poi_counter(sender, instance, origin=None, **kwargs):
+    """
+    Pull the tour's POI order counter back to the remaining POIs whenever a POI is
+    deleted, so deletes outside the API don't leave it ahead of MAX(order).
+    """
+    # Cascades from the tour (or its project) take the counter with them
+    if origin is not None and getattr(origin, 'model', type(origin)) is not POI:
+        return
+    instance.tour.resync_poi_counter()
+
+
+@receiver([post_save, post_delete], sender=POIAsset)
+def update_poi_media_stats(sender, instance, origin=None, **kwargs):
+    """
+    Recompute the POI's per-kind asset counts whenever one of its assets is
+    created, updated, or deleted.
+    """
+    # A delete that didn't start from POI assets is a cascade from the POI (or its
+    # tour/project) being deleted; its counters are about to disappear with it
+    if origin is not None and getattr(origin, 'model', type(origin)) is not POIAsset:
+        return
+    POI.objects.filter(pk=instance.poi_id).refresh_media_stats()  # type: ignore[attr-defined]
+
+
+@receiver([post_save, post_delete], sender=Tour)
+def update_project_public_center(sender, instance, origin=None, update_fields=None, **kwargs):
+    """
+    Recompute the project's denormalized public center whenever a tour is
+    created, deleted, or saved with a change that can move it.
+    """
+    # A delete that didn't start from tours is a cascade from the project being deleted
+    if origin is not None and getattr(origin, 'model', type(origin)) is not Tour:
+        return
+    # Saves limited to fields that can't move the center need no refresh
+    if update_fields is not None and not {'center', 'is_public', 'project'} & set(update_fields):
+        return
+    Project.objects.filter(pk=instance.project_id).refresh_public_center()  # type: ignore[attr-defined]
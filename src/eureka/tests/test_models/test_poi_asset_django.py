@@ -56,6 +56,21 @@ class TestPOIAsset(TestCase):
         self.assertEqual(poi_asset.poi, self.poi)
         self.assertEqual(poi_asset.source_asset, self.source_asset)
 
+    def test_poi_asset_type_keeps_case_and_counts_in_media_stats(self):
+        """Test that the type is stored as given and still counted case-insensitively."""
+        poi_asset = POIAsset.objects.create(
+            poi=self.poi,
+            source_asset=self.source_asset,
+            title={'locales': {'en': 'Test Asset'}},
+            type='Image/PNG',
+            url={'locales': {'en': '/test/image.png'}}
+        )
+
+        poi_asset.refresh_from_db()
+        self.assertEqual(poi_asset.type, 'Image/PNG')
+        self.poi.refresh_from_db()
+        self.assertEqual(self.poi.stat_image, 1)
+
     def test_ar_placement_default_value(self):
         """Test that ar_placement defaults to 'free'."""
         poi_asset = POIAsset.objects.create(
@@ -335,3 +350,31 @@ class TestPOIAsset(TestCase):
 
         poi_asset.refresh_from_db()
         self.assertIsNone(poi_asset.source_asset)
+
+    def test_poi_media_stats_follow_asset_changes(self):
+        """Test that the POI media stats are updated when assets are created, changed and deleted."""
+        image = POIAsset.objects.create(
+            poi=self.poi,
+            title={'locales': {'en': 'Image'}},
+            type='image/png',
+            url={'locales': {'en': '/test/image.png'}}
+        )
+        POIAsset.objects.create(
+            poi=self.poi,
+            title={'locales': {'en': 'Model'}},
+            type='model/gltf-binary',
+            url={'locales': {'en': '/test/model.glb'}}
+        )
+        self.poi.refresh_from_db()
+        self.assertEqual(self.poi.media_stats, {'image': 1, 'video': 0, 'audio': 0, 'model3d': 1, 'text': 0})
+
+        image.type = 'video/mp4'
+        image.save()
+        self.poi.refresh_from_db()
+        self.assertEqual(self.poi.stat_image, 0)
+        self.assertEqual(self.poi.stat_video, 1)
+
+        image.delete()
+        self.poi.refresh_from_db()
+        self.assertEqual(self.poi.stat_video, 0)
+        self.assertEqual(self.poi.stat_model3d, 1)
@@ -1,4 +1,5 @@
 from django.test import TestCase
+from django.db import IntegrityError, connection, transaction
 from django.contrib.auth import get_user_model
 from eureka.models import Project, Tour, POI
 import json
@@ -118,3 +119,36 @@ class TestPOI(TestCase):
         str_repr2 = str(poi2)
         json_data2 = json.loads(str_repr2)
         self.assertEqual(json_data2['radius'], 50)
+
+    def test_poi_order_unique_per_tour(self):
+        """Test that two POIs in the same tour cannot share an order."""
+        POI.objects.create(tour=self.tour, title={'locales': {'en': 'First POI'}}, order=1)
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                POI.objects.create(tour=self.tour, title={'locales': {'en': 'Second POI'}}, order=1)
+                # The constraint is deferred; force the check before the savepoint ends
+                connection.check_constraints()
+
+    def test_poi_json_fields_round_trip_from_database(self):
+        """Test that structured JSON fields decode back to the stored values."""
+        title = {'locales': {'en': 'Test POI', 'el': 'Δοκιμαστικό Σημείο'}}
+        external_links = {'locales': {'en': [{'title': 'Wiki', 'url': 'https://example.com', 'type': 'blog'}]}}
+        poi = POI.objects.create(
+            tour=self.tour,
+            title=title,
+            description=None,
+            coordinates={'lat': 37.9838, 'long': 23.7275},
+            external_links=external_links,
+            order=1
+        )
+
+        loaded = POI.objects.get(pk=poi.pk)
+
+        self.assertEqual(loaded.title, title)
+        self.assertEqual(loaded.coordinates, {'lat': 37.9838, 'long': 23.7275})
+        self.assertEqual(loaded.external_links, external_links)
+        self.assertIsNone(loaded.description)
+        self.assertEqual(
+            POI.objects.filter(pk=poi.pk).values_list('title__locales__el', flat=True).get(),
+            'Δοκιμαστικό Σημείο'
+        )
@@ -1,4 +1,6 @@
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from eureka.models import Project, Tour, POI, Asset, AssetType
 from eureka.models.poi_asset import POIAsset
@@ -103,4 +105,71 @@ class TestProject(TestCase):
         self.assertTrue(Tour.objects.filter(id=tour_b.id).exists())
         self.assertTrue(POI.objects.filter(id=poi_b.id).exists())
         self.assertTrue(Asset.objects.filter(id=asset_b.id).exists())
-        self.assertTrue(POIAsset.objects.filter(id=poi_asset_b.id).exists())
\ No newline at end of file
+        self.assertTrue(POIAsset.objects.filter(id=poi_asset_b.id).exists())
+
+    def test_project_with_stats_counts_tours_and_pois(self):
+        """Test that with_stats annotates tour and POI totals, including zeros."""
+        project = Project.objects.create(title='Project', group=self.user.personal_group)
+        empty_project = Project.objects.create(title='Empty Project', group=self.user.personal_group)
+        tour_a = Tour.objects.create(project=project, title={'locales': {'en': 'Tour A'}})
+        tour_b = Tour.objects.create(project=project, title={'locales': {'en': 'Tour B'}})
+        POI.objects.create(tour=tour_a, title={'locales': {'en': 'POI 1'}}, order=1)
+        POI.objects.create(tour=tour_a, title={'locales': {'en': 'POI 2'}}, order=2)
+        POI.objects.create(tour=tour_b, title={'locales': {'en': 'POI 3'}}, order=1)
+
+        stats = {p.pk: (p.total_tours, p.total_pois) for p in Project.objects.with_stats()}
+
+        self.assertEqual(stats[project.pk], (2, 3))
+        self.assertEqual(stats[empty_project.pk], (0, 0))
+
+    def test_project_deletion_skips_tour_bounding_box_refresh(self):
+        """Deleting a project should not recompute bounding boxes of the tours being deleted."""
+        project = Project.objects.create(title='Project To Delete', group=self.user.personal_group)
+        tour = Tour.objects.create(project=project, title={'locales': {'en': 'Tour'}})
+        for order in range(1, 4):
+            POI.objects.create(tour=tour, title={'locales': {'en': f'POI {order}'}}, coordinates={'lat': 37.9, 'long': 23.7}, order=order)
+
+        with CaptureQueriesContext(connection) as queries:
+            project.delete()
+
+        tour_updates = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('UPDATE "eureka_tour"')]
+        self.assertEqual(tour_updates, [])
+        self.assertFalse(Tour.objects.filter(id=tour.id).exists())
+
+    def test_project_public_center_follows_public_tours(self):
+        """Test that the stored public center tracks public tour centers as tours change."""
+        project = Project.objects.create(title='Project', group=self.user.personal_group)
+        public_tour = Tour.objects.create(
+            project=project, title={'locales': {'en': 'Public'}}, is_public=True, center={'lat': 10.0, 'long': 20.0}
+        )
+        private_tour = Tour.objects.create(
+            project=project, title={'locales': {'en': 'Private'}}, center={'lat': 30.0, 'long': 40.0}
+        )
+        project.refresh_from_db()
+        self.assertEqual(project.get_center(public_only=True), {'lat': 10.0, 'long': 20.0})
+
+        private_tour.is_public = True
+        private_tour.save()
+        project.refresh_from_db()
+        self.assertEqual(project.get_center(public_only=True), {'lat': 20.0, 'long': 30.0})
+
+        public_tour.delete()
+        private_tour.delete()
+        project.refresh_from_db()
+        self.assertIsNone(project.get_center(public_only=True))
+
+    def test_project_with_center_matches_get_center(self):
+        """Test that the with_center annotation agrees with get_center()."""
+        project = Project.objects.create(title='Project', group=self.user.personal_group)
+        empty_project = Project.objects.create(title='Empty Project', group=self.user.personal_group)
+        Tour.objects.create(project=project, title={'locales': {'en': 'A'}}, center={'lat': 10.0, 'long': 20.0})
+        Tour.objects.create(project=project, title={'locales': {'en': 'B'}}, center={'lat': 30.0, 'long': 40.0})
+        Tour.objects.create(project=project, title={'locales': {'en': 'No center'}})
+
+        annotated = {p.pk: p for p in Project.objects.with_center()}
+
+        self.assertEqual(
+            {'lat': annotated[project.pk].center_lat, 'long': annotated[project.pk].center_long},
+            project.get_center()
+        )
+        self.assertIsNone(annotated[empty_project.pk].center_lat)
@@ -1,6 +1,7 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from eureka.models import Project, Tour, POI
+from eureka.models.poi_asset import POIAsset
 import json
 
 User = get_user_model()
@@ -128,3 +129,22 @@ class TestTour(TestCase):
         str_repr = str(tour)
         json_data = json.loads(str_repr)
         self.assertTrue(json_data['is_public'])
+
+    def test_tour_with_stats_counts_pois_and_assets(self):
+        """Test that with_stats annotates POI and asset totals, including zeros."""
+        tour = Tour.objects.create(project=self.project, title={'locales': {'en': 'Tour'}})
+        empty_tour = Tour.objects.create(project=self.project, title={'locales': {'en': 'Empty Tour'}})
+        poi_a = POI.objects.create(tour=tour, title={'locales': {'en': 'POI 1'}}, order=1)
+        POI.objects.create(tour=tour, title={'locales': {'en': 'POI 2'}}, order=2)
+        for kind in ('image', 'video'):
+            POIAsset.objects.create(
+                poi=poi_a,
+                title={'locales': {'en': kind}},
+                type=kind,
+                url={'locales': {'en': f'/test/{kind}'}}
+            )
+
+        stats = {t.pk: (t.total_pois, t.total_assets) for t in Tour.objects.with_stats()}
+
+        self.assertEqual(stats[tour.pk], (2, 2))
+        self.assertEqual(stats[empty_tour.pk], (0, 0))
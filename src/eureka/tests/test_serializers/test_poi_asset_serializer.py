@@ -106,6 +106,7 @@ class TestPOIAssetSerializer(TestCase):
     def test_serializer_deserialization_with_ar_placement(self):
         """Test deserializing data with ar_placement field."""
         data = {
+            'poi_id': self.poi.id,
             'title': {'locales': {'en': 'New Asset'}},
             'type': 'model3d',
             'url': {'locales': {'en': '/test/model.glb'}},
@@ -396,3 +397,46 @@ class TestPOIAssetSerializer(TestCase):
 
         self.assertIn('spawn_radius', data)
         self.assertEqual(data['spawn_radius'], 8.5)
+
+    def test_serializer_requires_fields_without_source_asset(self):
+        """Test that title, type and url are required when no source_asset_id is provided."""
+        serializer = POIAssetSerializer(data={'priority': 'normal'})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('title', serializer.errors)
+        self.assertIn('type', serializer.errors)
+        self.assertIn('url', serializer.errors)
+
+    def test_serializer_fields_optional_with_source_asset(self):
+        """Test that title, type and url may be omitted when a source_asset_id is provided."""
+        serializer = POIAssetSerializer(data={'poi_id': self.poi.id, 'source_asset_id': self.source_asset.id})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+    def test_serializer_full_update_requires_fields(self):
+        """Test that a full update (PUT) still requires title, type and url."""
+        poi_asset = POIAsset.objects.create(
+            poi=self.poi,
+            title={'locales': {'en': 'Asset'}},
+            type='image',
+            url={'locales': {'en': '/test/image.jpg'}}
+        )
+        serializer = POIAssetSerializer(poi_asset, data={'priority': 'normal'})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(set(serializer.errors), {'title', 'type', 'url'})
+
+    def test_serializer_create_requires_poi_id(self):
+        """Test that a create is rejected without a poi_id, together with other field errors."""
+        serializer = POIAssetSerializer(data={'priority': 'normal'})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(set(serializer.errors), {'poi_id', 'title', 'type', 'url'})
+
+    def test_serializer_update_ignores_poi_id(self):
+        """Test that an update can't move the asset to another POI."""
+        poi_asset = POIAsset.objects.create(
+            poi=self.poi,
+            title={'locales': {'en': 'Asset'}},
+            type='image',
+            url={'locales': {'en': '/test/image.jpg'}}
+        )
+        serializer = POIAssetSerializer(poi_asset, data={'poi_id': self.poi.id + 1}, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertNotIn('poi_id', serializer.validated_data)
@@ -0,0 +1,48 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from eureka.models import Project
+from eureka.serializers.project_serializer import ProjectSerializer, ProjectSerializerLite
+
+User = get_user_model()
+
+
+class TestProjectSerializerFieldCache(TestCase):
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+            name='Test User'
+        )
+        self.project = Project.objects.create(
+            title={'locales': {'en': 'Test Project'}},
+            group=self.user.personal_group,
+            created_by=self.user
+        )
+
+    def test_instances_get_their_own_fields(self):
+        """Test that cached field maps are copied, not shared, between instances."""
+        first = ProjectSerializer(self.project)
+        second = ProjectSerializer(self.project)
+
+        self.assertEqual(list(first.fields), list(second.fields))
+        self.assertIsNot(first.fields['title'], second.fields['title'])
+        self.assertIs(first.fields['title'].parent, first)
+        self.assertIs(second.fields['title'].parent, second)
+
+    def test_subclasses_are_cached_separately(self):
+        """Test that the lite serializer does not pick up the full serializer's fields."""
+        ProjectSerializer(self.project).fields
+        lite_fields = ProjectSerializerLite(self.project).fields
+
+        self.assertNotIn('tours', lite_fields)
+        self.assertIn('tours', ProjectSerializer(self.project).fields)
+
+    def test_representation_is_unchanged(self):
+        """Test that repeated serialization renders the same data."""
+        first = ProjectSerializer(self.project).data
+        second = ProjectSerializer(self.project).data
+
+        self.assertEqual(first, second)
+        self.assertEqual(second['created_by']['username'], 'testuser')
@@ -0,0 +1,82 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from eureka.models import Project, Tour, POI
+from eureka.models.poi_asset import POIAsset
+
+User = get_user_model()
+
+
+class TestPOIAssetListConditionalGet(TestCase):
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+            name='Test User'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.project = Project.objects.create(
+            title={'locales': {'en': 'Test Project'}},
+            group=self.user.personal_group,
+            locales=['en']
+        )
+        self.tour = Tour.objects.create(
+            project=self.project,
+            title={'locales': {'en': 'Test Tour'}}
+        )
+        self.poi = POI.objects.create(
+            tour=self.tour,
+            title={'locales': {'en': 'Test POI'}},
+            order=1
+        )
+        self.poi_asset = POIAsset.objects.create(
+            poi=self.poi,
+            title={'locales': {'en': 'Test Asset'}},
+            type='image',
+            url={'locales': {'en': '/test/image.jpg'}}
+        )
+
+    def test_list_returns_etag(self):
+        """Test that the POI asset list includes an ETag validator."""
+        response = self.client.get(reverse('poi-asset-list-create'), {'poi_id': self.poi.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', response)
+
+    def test_list_not_modified_with_matching_etag(self):
+        """Test that a matching If-None-Match header returns 304."""
+        url = reverse('poi-asset-list-create')
+        first = self.client.get(url, {'poi_id': self.poi.id})
+
+        second = self.client.get(url, {'poi_id': self.poi.id}, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_etag_changes_after_delete(self):
+        """Test that deleting a POI asset invalidates the previous ETag."""
+        url = reverse('poi-asset-list-create')
+        first = self.client.get(url, {'poi_id': self.poi.id})
+
+        self.poi_asset.delete()
+        second = self.client.get(url, {'poi_id': self.poi.id}, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data, [])
+
+    def test_list_if_modified_since_sees_delete(self):
+        """Test that a date-only revalidation is not answered with 304 after a delete."""
+        url = reverse('poi-asset-list-create')
+        first = self.client.get(url, {'poi_id': self.poi.id})
+        self.assertNotIn('Last-Modified', first)
+
+        self.poi_asset.delete()
+        second = self.client.get(url, {'poi_id': self.poi.id}, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data, [])
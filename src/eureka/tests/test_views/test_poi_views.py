@@ -1,8 +1,11 @@
 from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from eureka.models import POI, Project, Tour
+from eureka.models.poi_asset import POIAsset
 
 
 User = get_user_model()
@@ -114,6 +117,42 @@ class TestPOIConcurrentCreation(TransactionTestCase):
         self.assertEqual(order_values, expected_orders,
                         f"Order values should be sequential from 1 to {num_pois}")
 
+    def test_create_response_has_empty_assets_and_stats(self):
+        """
+        Test that the create response reports no assets and zero media stats
+        for the new POI.
+        """
+        data = {
+            'tour_id': self.tour.id,
+            'title': {'locales': {'en': 'New POI'}},
+        }
+
+        response = self.client.post('/api/pois', data, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['assets'], [])
+        self.assertEqual(response.data['stats'], {
+            'image': 0, 'video': 0, 'audio': 0, 'model3d': 0, 'text': 0
+        })
+
+    def test_create_does_not_query_assets(self):
+        """
+        Test that creating a POI returns the full representation without
+        querying the POI asset table for the (necessarily empty) assets and stats.
+        """
+        data = {
+            'tour_id': self.tour.id,
+            'title': {'locales': {'en': 'New POI'}},
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/pois', data, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertIn('order', response.data)
+        asset_queries = [q['sql'] for q in queries.captured_queries if 'eureka_poiasset' in q['sql']]
+        self.assertEqual(asset_queries, [])
+
 
 class TestPOIDeletion(TransactionTestCase):
     """Test POI deletion and order updates"""
@@ -249,6 +288,26 @@ class TestPOIDeletion(TransactionTestCase):
         remaining_titles = [poi.title['locales']['en'] for poi in remaining_pois]
         self.assertEqual(remaining_titles, ['POI 1', 'POI 2'])
 
+    def test_create_after_delete_appends_without_gap(self):
+        """
+        Test that a POI created after deleting others, through the API or directly,
+        is appended right after the last remaining POI.
+        """
+        data = {'tour_id': self.tour.id, 'title': {'locales': {'en': 'New POI'}}}
+        for i in range(3):
+            self.client.post('/api/pois', data, format='json')
+        first, second, third = POI.objects.filter(tour=self.tour).order_by('order')
+
+        # Deleted through the API: the middle POI, so the last one is renumbered
+        self.client.delete(f'/api/pois/{second.id}')
+        response = self.client.post('/api/pois', data, format='json')
+        self.assertEqual(response.data['order'], 3)
+
+        # Deleted outside the API (e.g. the admin): no renumbering, but no gap either
+        POI.objects.filter(pk=response.data['id']).delete()
+        response = self.client.post('/api/pois', data, format='json')
+        self.assertEqual(response.data['order'], 3)
+
     def test_delete_poi_only_affects_same_tour(self):
         """
         Test that deleting a POI only affects POIs in the same tour,
@@ -318,3 +377,68 @@ class TestPOIDeletion(TransactionTestCase):
         remaining_count = POI.objects.filter(tour=self.tour).count()
         self.assertEqual(remaining_count, 0,
                         "No POIs should remain after deleting the only POI")
+
+
+class TestPOIListPagination(TransactionTestCase):
+    """Test optional limit/offset pagination of the POI list"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+            name='Test User'
+        )
+        self.project = Project.objects.create(
+            title={'locales': {'en': 'Test Project'}},
+            group=self.user.personal_group,
+            locales=['en']
+        )
+        self.tour = Tour.objects.create(
+            project=self.project,
+            title={'locales': {'en': 'Test Tour'}},
+            locales=['en']
+        )
+        for i in range(1, 4):
+            POI.objects.create(
+                tour=self.tour,
+                title={'locales': {'en': f'POI {i}'}},
+                order=i
+            )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_without_limit_is_not_paginated(self):
+        """Test that omitting limit returns the plain list of POIs."""
+        response = self.client.get('/api/pois', {'tour_id': self.tour.id})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 3)
+
+    def test_list_with_limit_is_paginated(self):
+        """Test that limit/offset return a page of POIs in order."""
+        response = self.client.get('/api/pois', {'tour_id': self.tour.id, 'limit': 2, 'offset': 1})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual([poi['order'] for poi in response.data['results']], [2, 3])
+
+    def test_list_fetches_assets_in_one_query(self):
+        """Test that the nested assets of all listed POIs are loaded with a single query."""
+        for poi in POI.objects.filter(tour=self.tour):
+            POIAsset.objects.create(
+                poi=poi,
+                title={'locales': {'en': 'Image'}},
+                type='image',
+                url={'locales': {'en': '/test/image.jpg'}}
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/pois', {'tour_id': self.tour.id})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(len(poi['assets']) == 1 for poi in response.data))
+        asset_queries = [q['sql'] for q in queries.captured_queries if 'FROM "eureka_poiasset"' in q['sql']]
+        self.assertEqual(len(asset_queries), 1)
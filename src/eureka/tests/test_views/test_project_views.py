@@ -0,0 +1,116 @@
+import json
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from eureka.models import Project, Tour, POI
+from eureka.renderers import dumps
+
+User = get_user_model()
+
+
+class TestProjectPopulatedStreaming(TestCase):
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+            name='Test User'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.project = Project.objects.create(
+            title={'locales': {'en': 'Test Project'}},
+            group=self.user.personal_group,
+            locales=['en']
+        )
+        for index in range(1, 3):
+            tour = Tour.objects.create(
+                project=self.project,
+                title={'locales': {'en': f'Tour {index}'}}
+            )
+            POI.objects.create(
+                tour=tour,
+                title={'locales': {'en': f'POI {index}'}},
+                order=1
+            )
+
+    def test_populated_project_streams_all_tours(self):
+        """Test that the streamed body is valid JSON with every tour and POI."""
+        response = self.client.get(reverse('project-populated', args=[self.project.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['id'], self.project.id)
+        self.assertEqual(data['total_tours'], 2)
+        self.assertEqual(len(data['tours']), 2)
+        self.assertEqual([len(tour['pois']) for tour in data['tours']], [1, 1])
+
+    def test_populated_project_stream_matches_serializer_output(self):
+        """Test that the streamed body equals the regular response, key order included."""
+        url = reverse('project-populated', args=[self.project.id])
+        # The browsable API renderer takes the non-streaming path
+        expected = json.loads(dumps(self.client.get(url, HTTP_ACCEPT='text/html').data))
+
+        data = json.loads(b''.join(self.client.get(url).streaming_content))
+
+        self.assertEqual(list(data), list(expected))
+        self.assertEqual(data, expected)
+
+    def test_populated_project_without_tours_streams_empty_list(self):
+        """Test that a project with no tours still produces a well-formed body."""
+        empty_project = Project.objects.create(
+            title={'locales': {'en': 'Empty Project'}},
+            group=self.user.personal_group,
+            locales=['en']
+        )
+
+        response = self.client.get(reverse('project-populated', args=[empty_project.id]))
+
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['tours'], [])
+
+
+class TestProjectMembers(TestCase):
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123',
+            name='Owner'
+        )
+        self.member = User.objects.create_user(
+            username='member',
+            email='member@example.com',
+            password='testpass123',
+            name='Member'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.project = Project.objects.create(
+            title={'locales': {'en': 'Test Project'}},
+            group=self.user.personal_group,
+            locales=['en']
+        )
+        self.member.groups.add(self.project.group)
+
+    def test_members_match_lite_serializer_output(self):
+        """Test that members are listed by username with the UserLiteSerializer fields."""
+        response = self.client.get(reverse('project-members', args=[self.project.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        self.assertEqual([m['username'] for m in data], ['member', 'owner'])
+        self.assertEqual(data[0], {
+            'id': self.member.id,
+            'username': 'member',
+            'email': 'member@example.com',
+            'name': 'Member'
+        })
@@ -173,6 +173,46 @@ class TestPublicProjectListView(TestCase):
         # The project with mixed tours (London location) should come first
         self.assertEqual(response.data[0]['id'], self.project_with_mixed_tours.id)
 
+    def test_public_project_list_proximity_ordering_paginates(self):
+        """
+        Test that limit/offset pages through the proximity-ordered projects.
+        """
+        response = self.client.get(
+            '/api/public/projects',
+            {'order_by': 'proximity', 'lat': 51.0, 'long': 0.0, 'limit': 1, 'offset': 1}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual([project['id'] for project in response.data['results']], [self.project_with_public_tour.id])
+
+    def test_public_project_list_proximity_ordering_puts_projects_without_center_last(self):
+        """
+        Test that projects whose public tours have no center are ordered after located ones.
+        """
+        project_without_center = Project.objects.create(
+            title={'locales': {'en': 'Project Without Center'}},
+            group=self.user2.personal_group,
+            locales=['en']
+        )
+        Tour.objects.create(
+            project=project_without_center,
+            title={'locales': {'en': 'Public Tour Without Center'}},
+            locales=['en'],
+            is_public=True
+        )
+
+        response = self.client.get(
+            '/api/public/projects',
+            {'order_by': 'proximity', 'lat': 40.0, 'long': -74.0}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [project['id'] for project in response.data],
+            [self.project_with_public_tour.id, self.project_with_mixed_tours.id, project_without_center.id]
+        )
+
 
 class TestPublicProjectPopulatedView(TestCase):
     """Test public project populated endpoint filtering"""
@@ -316,3 +356,28 @@ class TestPublicProjectPopulatedView(TestCase):
 
         self.assertIn('is_georeferenced', asset_data)
         self.assertFalse(asset_data['is_georeferenced'])
+
+    def test_public_project_populated_locale_applies_to_nested_data(self):
+        """
+        Test that the locale parameter reaches the nested tours, POIs and assets.
+        """
+        poi = POI.objects.create(
+            tour=self.public_tour,
+            title={'locales': {'en': 'Test POI', 'el': 'Σημείο'}},
+            order=0
+        )
+        POIAsset.objects.create(
+            poi=poi,
+            title={'locales': {'en': 'Test Asset', 'el': 'Αρχείο'}},
+            type='image',
+            url={'locales': {'en': 'https://example.com/image.jpg'}}
+        )
+
+        response = self.client.get(f'/api/public/projects/{self.project.id}/populated', {'locale': 'en'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tour_data = response.data['tours'][0]
+        poi_data = tour_data['pois'][0]
+        self.assertEqual(tour_data['title'], 'Public Tour')
+        self.assertEqual(poi_data['title'], 'Test POI')
+        self.assertEqual(poi_data['assets'][0]['title'], 'Test Asset')
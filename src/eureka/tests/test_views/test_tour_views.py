@@ -1,9 +1,17 @@
+import json
+from unittest import mock
+
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
-from eureka.models import Project, Tour
+from eureka.models import Project, Tour, POI
+from eureka.models.poi_asset import POIAsset
+from eureka.renderers import dumps
+from eureka.views.tour_views import PublishedTourView
 
 User = get_user_model()
 
@@ -44,6 +52,57 @@ class TestTourViews(TestCase):
         tour = Tour.objects.get(id=response.data['id'])
         self.assertEqual(tour.locales, ['en', 'fr', 'el'])
 
+    def test_create_tour_returns_empty_pois_and_stats(self):
+        """Test that the create response carries empty POIs and zero stats without loading them."""
+        data = {
+            'title': {'locales': {'en': 'API Test Tour'}},
+            'project_id': self.project.id
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('tour-list-create'), data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['pois'], [])
+        self.assertEqual(response.data['total_pois'], 0)
+        self.assertEqual(response.data['total_assets'], 0)
+        poi_queries = [q['sql'] for q in queries.captured_queries if 'FROM "eureka_poi" WHERE' in q['sql']]
+        self.assertEqual(poi_queries, [])
+
+    def test_list_tours_loads_pois_once(self):
+        """Test that listing tours reuses the ordered POI prefetch instead of querying per tour."""
+        for index in range(3):
+            tour = Tour.objects.create(project=self.project, title={'locales': {'en': f'Tour {index}'}})
+            POI.objects.create(tour=tour, title={'locales': {'en': 'POI'}}, order=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('tour-list-create'), {'project_id': self.project.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+        # Only the prefetch selects from eureka_poi directly (the counts are aliased subqueries)
+        poi_queries = [q['sql'] for q in queries.captured_queries if 'FROM "eureka_poi" WHERE' in q['sql']]
+        self.assertEqual(len(poi_queries), 1)
+
+    def test_list_tours_of_other_group_project_is_empty(self):
+        """Test that filtering by a project outside the user's groups returns no tours."""
+        other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123',
+            name='Other User'
+        )
+        other_project = Project.objects.create(
+            title={'locales': {'en': 'Other Project'}},
+            group=other_user.personal_group
+        )
+        Tour.objects.create(project=other_project, title={'locales': {'en': 'Other Tour'}})
+
+        response = self.client.get(reverse('tour-list-create'), {'project_id': other_project.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
     def test_create_tour_with_specific_locales_via_api(self):
         """Test that creating a tour via API with specific locales keeps those locales."""
         data = {
@@ -185,3 +244,198 @@ class TestTourViews(TestCase):
         # Verify it was saved to the database correctly
         tour.refresh_from_db()
         self.assertEqual(tour.locales, [])
+
+    def test_reorder_pois_resyncs_poi_counter(self):
+        """Test that a POI created after a reorder is appended right after the renumbered POIs."""
+        tour = Tour.objects.create(project=self.project, title={'locales': {'en': 'Tour'}})
+        pois = [POI.objects.create(tour=tour, title={'locales': {'en': 'POI'}}, order=tour.next_poi_order()) for _ in range(3)]
+
+        response = self.client.patch(
+            reverse('tour-detail', kwargs={'pk': tour.id}),
+            {'pois': [poi.id for poi in reversed(pois)]},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        tour.refresh_from_db()
+        self.assertEqual(tour.poi_counter, 2)
+        self.assertEqual(tour.next_poi_order(), 3)
+
+    def test_publish_tour_updates_status_and_public_center(self):
+        """Test that publishing a tour flips is_public and refreshes the project's public center."""
+        tour = Tour.objects.create(project=self.project, title={'locales': {'en': 'Tour'}})
+        # The tour's center comes from its POIs' coordinates
+        POI.objects.create(tour=tour, title={'locales': {'en': 'POI'}}, coordinates={'lat': 10.0, 'long': 20.0}, order=1)
+        tour.refresh_from_db()
+        self.assertEqual(tour.center, {'lat': 10.0, 'long': 20.0})
+
+        response = self.client.post(reverse('tour-publish', kwargs={'pk': tour.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['is_public'])
+        self.assertEqual(len(response.data['pois']), 1)
+        self.assertEqual(response.data['total_pois'], 1)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.public_center_lat, 10.0)
+        self.assertEqual(self.project.public_center_long, 20.0)
+
+    def test_publish_tour_permission_and_not_found(self):
+        """Test that tours outside the user's groups return 403 and missing tours 404."""
+        other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123',
+            name='Other User'
+        )
+        other_project = Project.objects.create(
+            title={'locales': {'en': 'Other Project'}},
+            group=other_user.personal_group
+        )
+        other_tour = Tour.objects.create(project=other_project, title={'locales': {'en': 'Other Tour'}})
+
+        forbidden = self.client.post(reverse('tour-publish', kwargs={'pk': other_tour.id}))
+        missing = self.client.post(reverse('tour-publish', kwargs={'pk': other_tour.id + 1000}))
+
+        self.assertEqual(forbidden.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+        other_tour.refresh_from_db()
+        self.assertFalse(other_tour.is_public)
+
+
+class TestPublishedTourView(TestCase):
+    def setUp(self):
+        """Set up a public tour with several POIs and assets."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+            name='Test User'
+        )
+        self.project = Project.objects.create(
+            title={'locales': {'en': 'Test Project'}},
+            group=self.user.personal_group,
+            locales=['en']
+        )
+        self.tour = Tour.objects.create(
+            project=self.project,
+            title={'locales': {'en': 'Published Tour'}},
+            is_public=True
+        )
+        for order in (2, 1, 3):
+            poi = POI.objects.create(
+                tour=self.tour,
+                title={'locales': {'en': f'POI {order}'}},
+                order=order
+            )
+            POIAsset.objects.create(
+                poi=poi,
+                title={'locales': {'en': f'Asset {order}'}},
+                type='image',
+                url={'locales': {'en': f'/test/{order}.jpg'}}
+            )
+
+    def test_published_tour_returns_ordered_pois_with_assets(self):
+        """Test that POIs come back in order, each with its assets."""
+        response = self.client.get(reverse('published-tour', kwargs={'pk': self.tour.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['id'], self.tour.id)
+        self.assertEqual([poi['order'] for poi in data['pois']], [1, 2, 3])
+        self.assertEqual([len(poi['assets']) for poi in data['pois']], [1, 1, 1])
+
+    def test_published_tour_stream_matches_regular_response(self):
+        """Test that the streamed body equals the non-streaming response, key order included."""
+        url = reverse('published-tour', kwargs={'pk': self.tour.id})
+        # The browsable API renderer takes the non-streaming path
+        expected = json.loads(dumps(self.client.get(url, HTTP_ACCEPT='text/html').data))
+
+        data = json.loads(b''.join(self.client.get(url).streaming_content))
+
+        self.assertEqual(list(data), list(expected))
+        self.assertEqual(data, expected)
+
+    def test_published_tour_query_count_does_not_grow_with_pois(self):
+        """Test that the tour, its POIs and their assets are loaded in three queries."""
+        # The throttles keep their history in the database cache; leave them out of the count
+        with mock.patch.object(PublishedTourView, 'throttle_classes', []), self.assertNumQueries(3):
+            response = self.client.get(reverse('published-tour', kwargs={'pk': self.tour.id}))
+            b''.join(response.streaming_content)
+
+    def test_published_tour_not_modified_with_matching_etag(self):
+        """Test that a matching If-None-Match header returns 304."""
+        url = reverse('published-tour', kwargs={'pk': self.tour.id})
+        first = self.client.get(url)
+
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_published_tour_etag_changes_after_asset_delete(self):
+        """Test that deleting a POI asset invalidates the previous ETag."""
+        url = reverse('published-tour', kwargs={'pk': self.tour.id})
+        first = self.client.get(url)
+
+        POIAsset.objects.filter(poi__tour=self.tour).first().delete()
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+
+    def test_published_tour_if_modified_since_sees_asset_delete(self):
+        """Test that a date-only revalidation is not answered with 304 after an asset delete."""
+        url = reverse('published-tour', kwargs={'pk': self.tour.id})
+        first = self.client.get(url)
+        self.assertNotIn('Last-Modified', first)
+
+        POIAsset.objects.filter(poi__tour=self.tour).first().delete()
+        second = self.client.get(url, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+
+    def test_published_tour_projects_multilingual_fields_to_locale(self):
+        """Test that a locale returns that translation, falling back to 'en' and keeping values without locales."""
+        poi = POI.objects.create(
+            tour=self.tour,
+            title={'locales': {'en': 'English POI', 'fr': 'POI français'}},
+            description=None,
+            external_links={'locales': {'en': [{'title': 'Wiki', 'url': 'https://example.com', 'type': 'blog'}]}},
+            order=4
+        )
+        POIAsset.objects.create(
+            poi=poi,
+            title={'locales': {'fr': 'Image française'}},
+            type='image',
+            url={'locales': {'en': '/test/en.jpg'}}
+        )
+
+        response = self.client.get(reverse('published-tour', kwargs={'pk': self.tour.id}), {'locale': 'fr'})
+
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['title'], 'Published Tour')
+        self.assertEqual(data['description'], {})
+        poi_data = data['pois'][-1]
+        self.assertEqual(poi_data['title'], 'POI français')
+        self.assertIsNone(poi_data['description'])
+        self.assertEqual(poi_data['external_links'], [{'title': 'Wiki', 'url': 'https://example.com', 'type': 'blog'}])
+        self.assertEqual(poi_data['assets'][0]['title'], 'Image française')
+        self.assertEqual(poi_data['assets'][0]['url'], '/test/en.jpg')
+
+    def test_published_tour_projects_linked_asset_to_locale(self):
+        """Test that a linked asset's title and url are returned for the locale, falling back to 'en'."""
+        linked_asset = {
+            'title': {'locales': {'en': 'Example', 'fr': 'Exemple'}},
+            'url': {'locales': {'en': 'https://example.com'}}
+        }
+        POIAsset.objects.filter(poi__tour=self.tour).update(linked_asset=linked_asset)
+        url = reverse('published-tour', kwargs={'pk': self.tour.id})
+
+        localized = json.loads(b''.join(self.client.get(url, {'locale': 'fr'}).streaming_content))
+        full = json.loads(b''.join(self.client.get(url).streaming_content))
+
+        self.assertEqual(
+            localized['pois'][0]['assets'][0]['linked_asset'],
+            {'title': 'Exemple', 'url': 'https://example.com'}
+        )
+        self.assertEqual(full['pois'][0]['assets'][0]['linked_asset'], linked_asset)
@@ -0,0 +1,131 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+
+User = get_user_model()
+
+
+class TestUserListView(TestCase):
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.users = [
+            User.objects.create_user(
+                username=f'user{index}',
+                email=f'user{index}@example.com',
+                password='testpass123',
+                name=f'User {index}'
+            )
+            for index in range(3)
+        ]
+        self.client.force_authenticate(user=self.users[0])
+
+    def test_list_without_limit_returns_plain_array(self):
+        """Test that the user list stays a plain array ordered by id without pagination params."""
+        response = self.client.get(reverse('user-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['id'] for user in response.data], [user.id for user in self.users])
+        self.assertEqual(set(response.data[0]), {'id', 'username', 'email', 'name', 'is_active', 'is_staff'})
+
+    def test_list_paginates_with_limit_and_offset(self):
+        """Test that limit/offset pages through the users."""
+        response = self.client.get(reverse('user-list'), {'limit': 1, 'offset': 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual([user['id'] for user in response.data['results']], [self.users[1].id])
+
+
+class TestCurrentUserView(TestCase):
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+            name='Test User'
+        )
+
+    def test_current_user_requires_authentication(self):
+        """Test that anonymous requests are rejected by the permission layer."""
+        response = self.client.get(reverse('auth-me'))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_current_user_returns_user_details(self):
+        """Test that an authenticated user gets their own details."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(reverse('auth-me'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['user_id'], str(self.user.id))
+        self.assertEqual(response.data['email'], 'test@example.com')
+
+
+class TestLoginView(TestCase):
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+            name='Test User'
+        )
+
+    def test_login_returns_token(self):
+        """Test that an active user can log in with their email."""
+        response = self.client.post(reverse('auth-login'), {'login': 'test@example.com', 'password': 'testpass123'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('token', response.data)
+
+    def test_login_disabled_user_skips_password_check(self):
+        """Test that a disabled account is rejected after one dummy hash instead of a password check."""
+        self.user.is_active = False
+        self.user.save()
+
+        with mock.patch.object(User, 'check_password') as check_password, \
+                mock.patch.object(User, 'set_password') as set_password:
+            response = self.client.post(reverse('auth-login'), {'login': 'test@example.com', 'password': 'testpass123'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        check_password.assert_not_called()
+        set_password.assert_called_once_with('testpass123')
+
+    def test_login_is_throttled(self):
+        """Test that repeated login attempts from one client are throttled."""
+        for _ in range(10):
+            self.client.post(reverse('auth-login'), {'login': 'test@example.com', 'password': 'wrong'})
+
+        response = self.client.post(reverse('auth-login'), {'login': 'test@example.com', 'password': 'testpass123'})
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_login_throttle_is_per_login_and_client(self):
+        """Test that one client's failed attempts don't throttle other logins or other clients."""
+        other = User.objects.create_user(username='otheruser', email='other@example.com', password='otherpass123', name='Other User')
+        for _ in range(10):
+            self.client.post(reverse('auth-login'), {'login': 'test@example.com', 'password': 'wrong'}, REMOTE_ADDR='10.0.0.1')
+
+        throttled = self.client.post(reverse('auth-login'), {'login': 'test@example.com', 'password': 'testpass123'}, REMOTE_ADDR='10.0.0.1')
+        other_client = self.client.post(reverse('auth-login'), {'login': 'test@example.com', 'password': 'testpass123'}, REMOTE_ADDR='10.0.0.2')
+        other_login = self.client.post(reverse('auth-login'), {'login': other.email, 'password': 'otherpass123'}, REMOTE_ADDR='10.0.0.1')
+
+        self.assertEqual(throttled.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(other_client.status_code, status.HTTP_200_OK)
+        self.assertEqual(other_login.status_code, status.HTTP_200_OK)
+
+    def test_successful_logins_are_not_throttled(self):
+        """Test that successful logins don't use up the failed-attempt budget."""
+        for _ in range(11):
+            response = self.client.post(reverse('auth-login'), {'login': 'test@example.com', 'password': 'testpass123'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
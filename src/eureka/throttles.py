@@ -0,0 +1,35 @@
+# src/eureka/throttles.py
+import hashlib
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class FailedLoginThrottle(SimpleRateThrottle):
+    """
+    Throttle password logins per submitted login and client IP, counting only
+    failed attempts.
+
+    Keying on the pair means guessing one account's password from one address is
+    slowed down without locking out other users behind the same address, or the
+    same user on another one. Checking the limit does not use it up; the view
+    calls `record_failure` when the credentials are rejected.
+    """
+    scope = 'login_failure'
+
+    def get_cache_key(self, request, view):
+        login = str(request.data.get('login', '')).strip().lower()
+        # Hash the submitted value so arbitrary client input never ends up in a cache key
+        ident = hashlib.sha256(f'{login}|{self.get_ident(request)}'.encode()).hexdigest()
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+    def throttle_success(self):
+        # Only failed attempts count towards the limit (see record_failure)
+        return True
+
+    def record_failure(self, request, view):
+        """Add a failed attempt to the history of this login and client IP."""
+        key = self.get_cache_key(request, view)
+        now = self.timer()
+        history = [timestamp for timestamp in self.cache.get(key, []) if timestamp > now - self.duration]
+        history.insert(0, now)
+        self.cache.set(key, history, self.duration)
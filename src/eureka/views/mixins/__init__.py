@@ -4,10 +4,12 @@ View mixins for reusable functionality across views.
 from .locale import LocaleContextMixin
 from .queryset import TourPrefetchMixin, POIPrefetchMixin
 from .permission import POIAssetPermissionMixin
+from .conditional import ConditionalGetMixin
 
 __all__ = [
     'LocaleContextMixin',
     'TourPrefetchMixin',
     'POIPrefetchMixin',
     'POIAssetPermissionMixin',
+    'ConditionalGetMixin',
 ]
@@ -0,0 +1,48 @@
+"""
+Mixin for HTTP conditional GET support (ETag).
+Lets read endpoints answer with 304 Not Modified without serializing anything.
+"""
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
+
+
+class ConditionalGetMixin:
+    """
+    Mixin providing helpers to short-circuit GET requests with an ETag.
+
+    Views compute a version string for the data they are about to return
+    (e.g. from MAX(updated_at) and a row count), then call
+    `get_not_modified_response` before doing any serialization work and
+    `set_conditional_headers` on the final response.
+
+    No Last-Modified validator is offered: deleting a row lowers the count in
+    the version but never raises MAX(updated_at), so If-Modified-Since would
+    get a stale 304.
+    """
+
+    def build_etag(self, *parts):
+        """Build a quoted ETag from the given version parts."""
+        return quote_etag('-'.join(str(part) for part in parts))
+
+    def get_not_modified_response(self, request, etag=None):
+        """
+        Return a 304/412 response if the request's If-None-Match/If-Match match, otherwise None.
+
+        Args:
+            request: The HTTP request object
+            etag: Quoted ETag for the current representation
+        """
+        return get_conditional_response(request, etag=etag)
+
+    def set_conditional_headers(self, response, etag=None):
+        """
+        Attach the ETag header to the response.
+
+        Responses depend on the authenticated user, so they are marked private
+        and vary on the Authorization header.
+        """
+        if etag:
+            response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization'])
+        return response
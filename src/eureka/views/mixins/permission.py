@@ -2,10 +2,12 @@
 Mixins for permission checking and object retrieval.
 """
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F
 from rest_framework import status
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 from eureka.models.poi_asset import POIAsset
+from eureka.permissions import get_user_group_ids
 
 
 class POIAssetPermissionMixin:
@@ -32,11 +34,11 @@ class POIAssetPermissionMixin:
         Raises:
             PermissionDenied: If user is not a member of the POI asset's project group
         """
-        user_groups = request.user.groups.all()
-
         try:
-            poi_asset = POIAsset.objects.select_related(
-                'poi__tour__project__group'
+            # Only the project's group id is needed for the check, so annotate it
+            # instead of loading the POI, tour and project rows
+            poi_asset = POIAsset.objects.annotate(
+                project_group_id=F('poi__tour__project__group_id')
             ).get(pk=pk)
         except ObjectDoesNotExist:
             return None, Response(
@@ -44,7 +46,7 @@ class POIAssetPermissionMixin:
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        if poi_asset.poi.tour.project.group not in user_groups:
+        if poi_asset.project_group_id not in get_user_group_ids(request):
             raise PermissionDenied('Not a member of the POI asset project group.')
 
         return poi_asset, None
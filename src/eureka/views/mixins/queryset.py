@@ -2,19 +2,32 @@
 Mixins for reusable queryset optimization patterns.
 These mixins provide common prefetch and annotation logic to avoid code duplication.
 """
-from django.db.models import Count, Q, Prefetch
+from django.db.models import Prefetch
 from ...models.tour import Tour
-from ...models.poi import POI
+from ...models.poi import POI, MEDIA_STAT_FIELDS
+from ...models.poi_asset import POIAsset
+
+# Columns read by the nested serializers of the populated project endpoints; the
+# foreign keys are kept so the prefetches can attach rows to their parents
+POPULATED_TOUR_FIELDS = (
+    'id', 'project', 'title', 'description', 'is_public', 'bounding_box', 'center',
+    'distance_meters', 'duration_minutes', 'locales', 'guided', 'cover_photo',
+)
+POPULATED_POI_FIELDS = (
+    'id', 'tour', 'title', 'description', 'coordinates', 'radius',
+    'external_links', 'thumbnail', 'order', *MEDIA_STAT_FIELDS,
+)
+POPULATED_POI_ASSET_FIELDS = (
+    'id', 'poi', 'title', 'description', 'type', 'url', 'priority', 'view_in_ar',
+    'ar_placement', 'georeference', 'linked_asset', 'model_transform',
+)
 
 class TourPrefetchMixin:
     @staticmethod
     def get_tour_prefetch():
         return Prefetch(
             'tours',
-            queryset=Tour.objects.annotate(
-                total_pois=Count('pois', distinct=True),
-                total_assets=Count('pois__assets', distinct=True)
-            )
+            queryset=Tour.objects.with_stats()
         )
 
 class POIPrefetchMixin:
@@ -22,11 +35,25 @@ class POIPrefetchMixin:
     def get_poi_prefetch():
         return Prefetch(
             'pois',
-            queryset=POI.objects.prefetch_related('assets').annotate(
-                stat_image=Count('assets', filter=Q(assets__type__istartswith='image') | Q(assets__type='image')),
-                stat_video=Count('assets', filter=Q(assets__type__istartswith='video') | Q(assets__type='video')),
-                stat_audio=Count('assets', filter=Q(assets__type__istartswith='audio') | Q(assets__type='audio')),
-                stat_model3d=Count('assets', filter=Q(assets__type__istartswith='model') | Q(assets__type='model3d')),
-                stat_text=Count('assets', filter=Q(assets__type__istartswith='text') | Q(assets__type='text'))
+            queryset=POI.objects.prefetch_related('assets').order_by('order')
+        )
+
+    @classmethod
+    def get_tour_queryset(cls):
+        """Tour queryset for TourSerializer responses: POIs prefetched, counts annotated"""
+        return Tour.objects.prefetch_related(cls.get_poi_prefetch()).with_stats()
+
+    @classmethod
+    def get_tour_detail_queryset(cls):
+        """Tour queryset for single-tour responses, with the project joined for permission checks"""
+        return cls.get_tour_queryset().select_related('project')
+
+    @staticmethod
+    def get_populated_poi_prefetch():
+        """POI prefetch for the populated project endpoints, loading only the serialized columns"""
+        return Prefetch(
+            'pois',
+            queryset=POI.objects.only(*POPULATED_POI_FIELDS).prefetch_related(
+                Prefetch('assets', queryset=POIAsset.objects.only(*POPULATED_POI_ASSET_FIELDS))
             ).order_by('order')
         )
@@ -1,15 +1,17 @@
-from rest_framework import generics, permissions, status
+from rest_framework import generics, serializers, status
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
+from django.db.models import Count, Max
 from eureka.models.poi_asset import POIAsset
 from eureka.models.poi import POI
 from eureka.models.asset import Asset
 from eureka.serializers.poi_asset_serializer import POIAssetSerializer
+from eureka.permissions import InProjectGroup, get_user_group_ids
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
-from .mixins import LocaleContextMixin, POIAssetPermissionMixin
+from .mixins import LocaleContextMixin, POIAssetPermissionMixin, ConditionalGetMixin
 
 @extend_schema(
     methods=['GET'],
@@ -75,16 +77,16 @@ from .mixins import LocaleContextMixin, POIAssetPermissionMixin
         )
     }
 )
-class POIAssetListCreateView(LocaleContextMixin, generics.ListCreateAPIView):
+class POIAssetListCreateView(ConditionalGetMixin, LocaleContextMixin, generics.ListCreateAPIView):
     serializer_class = POIAssetSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [InProjectGroup]
 
-    def get_queryset(self):
-        user = self.request.user
-        user_groups = user.groups.all()
+    # Fields copied from the source asset when not provided in the request
+    SOURCE_ASSET_COPY_FIELDS = ('title', 'description', 'type', 'url')
 
+    def get_queryset(self):
         # Filter POI assets by user's accessible projects
-        queryset = POIAsset.objects.filter(poi__tour__project__group__in=user_groups)
+        queryset = POIAsset.objects.filter(poi__tour__project__group_id__in=get_user_group_ids(self.request))
 
         poi_id = self.request.query_params.get('poi_id')
         if poi_id:
@@ -92,21 +94,40 @@ class POIAssetListCreateView(LocaleContextMixin, generics.ListCreateAPIView):
 
         return queryset.order_by('-created_at')
 
+    def list(self, request, *args, **kwargs):
+        """
+        Support conditional GET: the representation only changes when a visible POI asset
+        is added, removed or updated, so answer 304 before serializing if nothing changed.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        version = queryset.aggregate(last_modified=Max('updated_at'), total=Count('id'))
+        last_modified = version['last_modified']
+        etag = self.build_etag(
+            request.user.pk,
+            version['total'],
+            last_modified.timestamp() if last_modified else 0,
+            request.query_params.get('locale', ''),
+        )
+
+        not_modified = self.get_not_modified_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().list(request, *args, **kwargs)
+        return self.set_conditional_headers(response, etag=etag)
+
     def perform_create(self, serializer):
-        user = self.request.user
-        poi_id = self.request.data.get('poi_id')
+        # Required on create by the serializer; the view attaches the POI instance itself
+        poi_id = serializer.validated_data.pop('poi_id')
         source_asset_id = self.request.data.get('source_asset_id')
 
-        if not poi_id:
-            raise PermissionDenied('poi_id is required to create a POI asset.')
-
         try:
-            poi = POI.objects.get(pk=poi_id)  # type: ignore[attr-defined]
+            poi = POI.objects.select_related('tour__project').get(pk=poi_id)  # type: ignore[attr-defined]
         except ObjectDoesNotExist:
             raise PermissionDenied('POI not found.')
 
-        # Check user has access to the POI's project
-        if poi.tour.project.group not in user.groups.all():
+        # Check user has access to the POI's project (group ids were loaded by InProjectGroup)
+        if poi.tour.project.group_id not in get_user_group_ids(self.request):
             raise PermissionDenied('Not a member of the POI project group.')
 
         validated_data = serializer.validated_data
@@ -123,37 +144,35 @@ class POIAssetListCreateView(LocaleContextMixin, generics.ListCreateAPIView):
             # Case 1: Creating POI asset from an existing source asset
             source_asset = None
             if source_asset_id:
-                try:
-                    source_asset = Asset.objects.get(pk=source_asset_id)  # type: ignore[attr-defined]
-                    # Ensure source asset belongs to the same project as the POI
-                    if source_asset.project != poi.tour.project:
-                        raise PermissionDenied('Source asset must belong to the same project as the POI.')
-                except ObjectDoesNotExist:
-                    # Source asset was deleted - we'll create a new one below
-                    source_asset = None
+                # Only load the fields that will actually be copied, so multilingual JSON blobs
+                # the client already provided are not pulled from the database
+                fields_to_copy = [field for field in self.SOURCE_ASSET_COPY_FIELDS if field not in validated_data]
+                # A missing source asset (deleted) yields None - we'll create a new one below
+                source_asset = Asset.objects.only(  # type: ignore[attr-defined]
+                    'id', 'project', *fields_to_copy
+                ).filter(pk=source_asset_id).first()
+                # Ensure source asset belongs to the same project as the POI (compare FK ids, no extra fetch)
+                if source_asset and source_asset.project_id != poi.tour.project_id:
+                    raise PermissionDenied('Source asset must belong to the same project as the POI.')
 
             if source_asset:
                 # Copy fields from source asset if not provided
-                if 'title' not in validated_data:
-                    validated_data['title'] = source_asset.title
-                if 'description' not in validated_data:
-                    validated_data['description'] = source_asset.description
-                if 'type' not in validated_data:
-                    validated_data['type'] = source_asset.type
-                if 'url' not in validated_data:
-                    validated_data['url'] = source_asset.url
+                for field in fields_to_copy:
+                    validated_data[field] = getattr(source_asset, field)
 
                 serializer.save(poi=poi, source_asset=source_asset)
 
             # Case 2: Creating POI asset from scratch (no source asset provided, or source asset was deleted)
             else:
-                # Validate required fields when creating from scratch
-                if 'title' not in validated_data:
-                    raise PermissionDenied('title is required when creating POI asset without source_asset_id.')
-                if 'type' not in validated_data:
-                    raise PermissionDenied('type is required when creating POI asset without source_asset_id.')
-                if 'url' not in validated_data:
-                    raise PermissionDenied('url is required when creating POI asset without source_asset_id.')
+                # The serializer only enforces title/type/url when no source_asset_id was sent,
+                # so a deleted source asset still needs those fields to create from scratch
+                missing = {
+                    field: 'This field is required when the source asset no longer exists.'
+                    for field in POIAssetSerializer.FIELDS_REQUIRED_WITHOUT_SOURCE
+                    if field not in validated_data
+                }
+                if missing:
+                    raise serializers.ValidationError(missing)
 
                 # Create a new Asset as the source
                 new_asset = Asset.objects.create(  # type: ignore[attr-defined]
@@ -199,24 +218,24 @@ class POIAssetListCreateView(LocaleContextMixin, generics.ListCreateAPIView):
 )
 class POIAssetRetrieveUpdateDestroyView(LocaleContextMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = POIAssetSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [InProjectGroup]
 
     def get_queryset(self):
-        user = self.request.user
-        user_groups = user.groups.all()
         # Include POI assets from projects that user has access to
         return POIAsset.objects.filter(
-            poi__tour__project__group__in=user_groups
+            poi__tour__project__group_id__in=get_user_group_ids(self.request)
         )  # type: ignore[attr-defined]
 
     def perform_update(self, serializer):
         validated_data = serializer.validated_data
-        poi_asset = self.get_object()
+        # UpdateModelMixin.update() has already fetched and permission-checked the instance
+        poi_asset = serializer.instance
 
         # Use transaction to ensure atomicity
         with transaction.atomic():
-            # If priority is being set to 'high', demote all other POI assets of the same POI
-            if validated_data.get('priority') == 'high':
+            # If priority is being changed to 'high', demote all other POI assets of the same POI.
+            # An asset that is already primary has nothing to demote.
+            if validated_data.get('priority') == 'high' and poi_asset.priority != 'high':
                 POIAsset.objects.filter(  # type: ignore[attr-defined]
                     poi=poi_asset.poi,
                     priority='high'
@@ -262,7 +281,7 @@ class POIAssetRetrieveUpdateDestroyView(LocaleContextMixin, generics.RetrieveUpd
     }
 )
 class POIAssetSetPrimaryView(POIAssetPermissionMixin, APIView):
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [InProjectGroup]
 
     def post(self, request, pk):
         # Get POI asset and check permissions
@@ -274,13 +293,14 @@ class POIAssetSetPrimaryView(POIAssetPermissionMixin, APIView):
         with transaction.atomic():
             # Demote all other POI assets of the same POI from 'high' to 'normal'
             POIAsset.objects.filter(  # type: ignore[attr-defined]
-                poi=poi_asset.poi,
+                poi_id=poi_asset.poi_id,
                 priority='high'
             ).exclude(pk=pk).update(priority='normal')
 
-            # Set this POI asset as primary
+            # Set this POI asset as primary, writing only the changed columns
+            # (auto_now still stamps updated_at) instead of the multilingual JSON fields
             poi_asset.priority = 'high'
-            poi_asset.save()
+            poi_asset.save(update_fields=['priority', 'updated_at'])
 
         # Return the updated POI asset
         context = self.build_serializer_context(request)
@@ -325,7 +345,7 @@ class POIAssetSetPrimaryView(POIAssetPermissionMixin, APIView):
     }
 )
 class POIAssetUnsetPrimaryView(POIAssetPermissionMixin, APIView):
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [InProjectGroup]
 
     def post(self, request, pk):
         # Get POI asset and check permissions
@@ -336,7 +356,7 @@ class POIAssetUnsetPrimaryView(POIAssetPermissionMixin, APIView):
         # Set priority to normal (no mutations to other POI assets)
         with transaction.atomic():
             poi_asset.priority = 'normal'
-            poi_asset.save()
+            poi_asset.save(update_fields=['priority', 'updated_at'])
 
         # Return the updated POI asset
         context = self.build_serializer_context(request)
@@ -1,18 +1,27 @@
+import uuid
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework.renderers import BrowsableAPIRenderer
 from django.contrib.auth.models import Group
-from django.db.models import Count, Prefetch
+from django.db import transaction
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from ..models.project import Project
 from ..models.tour import Tour
-from ..serializers.project_serializer import ProjectSerializer
+from ..models.user import User
+from ..serializers.project_serializer import ProjectSerializer, ProjectSerializerLite
 from ..serializers.nested_serializers import ProjectPopulatedSerializer
 from ..serializers.user_serializer import UserLiteSerializer
 from ..serializers.group_serializer import GroupMemberManagementSerializer
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
-from django.core.exceptions import ObjectDoesNotExist
 from rest_framework.exceptions import PermissionDenied
+from ..permissions import get_user_group_ids
+from ..prefetch import prefetch_empty
+from ..renderers import ORJSONRenderer, stream_object_with_list
 from .mixins import LocaleContextMixin, TourPrefetchMixin, POIPrefetchMixin
+from .mixins.queryset import POPULATED_TOUR_FIELDS
 
 @extend_schema(
     methods=['GET'],
@@ -60,37 +69,29 @@ from .mixins import LocaleContextMixin, TourPrefetchMixin, POIPrefetchMixin
 class ProjectListCreateView(TourPrefetchMixin, LocaleContextMixin, generics.ListCreateAPIView):
     serializer_class = ProjectSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def get_queryset(self):
-        user_groups = self.request.user.groups.all()
-
         # For list view: only annotate with counts, don't prefetch tours
         # This is much more efficient when fetching multiple projects
-        return Project.objects.filter(group__in=user_groups).annotate(  # type: ignore[attr-defined]
-            total_tours=Count('tours', distinct=True),
-            total_pois=Count('tours__pois', distinct=True)
-        )
+        return Project.objects.filter(  # type: ignore[attr-defined]
+            group_id__in=get_user_group_ids(self.request)
+        ).select_related('created_by').with_stats().with_center()
 
     def get_serializer_class(self):
         """Use ProjectSerializer without tours field for list view"""
-        # Import here to avoid circular dependency
-        from ..serializers.project_serializer import ProjectSerializer, ProjectSerializerLite
-
         # For list view (GET), use lite serializer without tours
         if self.request.method == 'GET':
             return ProjectSerializerLite
-        # For create (POST), we'll use the full serializer since we refetch
+        # For create (POST), use the full serializer
         return ProjectSerializer
 
     def perform_create(self, serializer):
-        from django.db import transaction
-        import uuid
         user = self.request.user
 
-        with transaction.atomic():
-            group_name = f'project_{uuid.uuid4().hex[:12]}'
-            group = Group.objects.create(name=group_name)
-            user.groups.add(group)
+        group_name = f'project_{uuid.uuid4().hex[:12]}'
+        group = Group.objects.create(name=group_name)
+        user.groups.add(group)
 
         serializer.save(group=group, created_by=user)
 
@@ -98,20 +99,18 @@ class ProjectListCreateView(TourPrefetchMixin, LocaleContextMixin, generics.List
         """Override create to return the instance with optimized queryset including tours"""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
-
-        # Refetch the created instance with tours prefetch
-        user_groups = request.user.groups.all()
-        instance = Project.objects.filter(  # type: ignore[attr-defined]
-            pk=serializer.instance.pk,
-            group__in=user_groups
-        ).prefetch_related(self.get_tour_prefetch()).annotate(
-            total_tours=Count('tours', distinct=True),
-            total_pois=Count('tours__pois', distinct=True)
-        ).first()
+
+        with transaction.atomic():
+            self.perform_create(serializer)
+
+        # A freshly created project has no tours, so attach the empty prefetch
+        # and stats directly instead of refetching the row
+        instance = serializer.instance
+        prefetch_empty(instance, 'tours')
+        instance.total_tours = 0
+        instance.total_pois = 0
 
         # Use the full ProjectSerializer for the response
-        from ..serializers.project_serializer import ProjectSerializer
         serializer = ProjectSerializer(instance, context={'request': request})
 
         headers = self.get_success_headers(serializer.data)
@@ -166,20 +165,20 @@ class ProjectListCreateView(TourPrefetchMixin, LocaleContextMixin, generics.List
 class ProjectRetrieveUpdateDestroyView(TourPrefetchMixin, LocaleContextMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = ProjectSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     queryset = Project.objects.all()  # type: ignore[attr-defined]
 
     def get_queryset(self):
-        user_groups = self.request.user.groups.all()
+        queryset = Project.objects.filter(group_id__in=get_user_group_ids(self.request))  # type: ignore[attr-defined]
+
+        # Deleting renders nothing, so skip the tours prefetch and stats subqueries
+        if self.request.method == 'DELETE':
+            return queryset
 
         # Note: We only prefetch tours without their nested POIs.
         # This keeps the query efficient for the project detail view.
         # If you need fully populated tours with POIs, use the ProjectPopulatedView endpoint instead.
-        return Project.objects.filter(group__in=user_groups).prefetch_related(  # type: ignore[attr-defined]
-            self.get_tour_prefetch()
-        ).annotate(
-            total_tours=Count('tours', distinct=True),
-            total_pois=Count('tours__pois', distinct=True)
-        )
+        return queryset.prefetch_related(self.get_tour_prefetch()).with_stats()
 
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
@@ -225,7 +224,7 @@ class ProjectRetrieveUpdateDestroyView(TourPrefetchMixin, LocaleContextMixin, ge
             ]
         ),
         404: OpenApiResponse(
-            description="Group not found",
+            description="Project or group not found",
             response={
                 'type': 'object',
                 'properties': {
@@ -234,6 +233,7 @@ class ProjectRetrieveUpdateDestroyView(TourPrefetchMixin, LocaleContextMixin, ge
                 'required': ['detail']
             },
             examples=[
+                OpenApiExample('Project Not Found', value={'detail': 'Not found.'}),
                 OpenApiExample('Group Not Found', value={'detail': 'Group not found.'})
             ]
         )
@@ -243,17 +243,25 @@ class ProjectMoveGroupView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, pk):
-        project = Project.objects.get(pk=pk)  # type: ignore[attr-defined]
+        # Scope the lookup to the user's groups so projects outside them are
+        # indistinguishable from missing ones
+        project = Project.objects.filter(  # type: ignore[attr-defined]
+            pk=pk, group_id__in=get_user_group_ids(request)
+        ).only('id', 'group_id').first()
+        if project is None:
+            return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
         group_id = request.data.get('group_id')
         user = request.user
-        try:
-            target_group = Group.objects.get(pk=group_id)
-        except ObjectDoesNotExist:
-            return Response({'detail': 'Group not found.'}, status=status.HTTP_404_NOT_FOUND)
-        if target_group not in user.groups.all():
+        # Fetch the group and check membership in one query; only a miss needs a
+        # second lookup to tell a missing group from one the user isn't in
+        target_group = Group.objects.filter(pk=group_id, user=user).first()
+        if target_group is None:
+            if not Group.objects.filter(pk=group_id).exists():
+                return Response({'detail': 'Group not found.'}, status=status.HTTP_404_NOT_FOUND)
             return Response({'detail': 'Not a member of the target group.'}, status=status.HTTP_403_FORBIDDEN)
-        project.group = target_group
-        project.save()
+        Project.objects.filter(pk=project.pk).update(  # type: ignore[attr-defined]
+            group_id=target_group.pk, updated_at=timezone.now()
+        )
         return Response({'detail': 'Project group updated.'})
 
 @extend_schema(
@@ -324,6 +332,7 @@ class ProjectPopulatedView(POIPrefetchMixin, LocaleContextMixin, generics.Retrie
     """
     serializer_class = ProjectPopulatedSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def get_queryset(self):
         """
@@ -335,16 +344,13 @@ class ProjectPopulatedView(POIPrefetchMixin, LocaleContextMixin, generics.Retrie
         3. POIs are ordered correctly
         4. Assets are included for each POI
         """
-        user_groups = self.request.user.groups.all()
-
         # Check if we should filter for public tours only
         public_only = self.request.query_params.get('public_only', '').lower() == 'true'
 
         # Build tour queryset with optional public filter
-        tour_queryset = Tour.objects.prefetch_related(self.get_poi_prefetch()).annotate(  # type: ignore[attr-defined]
-            total_pois=Count('pois', distinct=True),
-            total_assets=Count('pois__assets', distinct=True)
-        )
+        tour_queryset = Tour.objects.only(*POPULATED_TOUR_FIELDS).prefetch_related(  # type: ignore[attr-defined]
+            self.get_populated_poi_prefetch()
+        ).with_stats()
 
         if public_only:
             tour_queryset = tour_queryset.filter(is_public=True)
@@ -355,15 +361,46 @@ class ProjectPopulatedView(POIPrefetchMixin, LocaleContextMixin, generics.Retrie
             queryset=tour_queryset
         )
 
-        # Main queryset with all prefetches and project-level annotations
-        return Project.objects.filter(  # type: ignore[attr-defined]
-            group__in=user_groups
+        # Main queryset with all prefetches
+        queryset = Project.objects.filter(  # type: ignore[attr-defined]
+            group_id__in=get_user_group_ids(self.request)
         ).prefetch_related(
             tour_prefetch,
             'group__user_set'  # Prefetch group members to avoid N+1 queries
-        ).annotate(
-            total_tours=Count('tours', distinct=True),
-            total_pois=Count('tours__pois', distinct=True)
+        )
+
+        # Without public_only every tour and POI is prefetched, so the serializer counts
+        # them from the loaded lists; otherwise the totals still cover all tours
+        if public_only:
+            queryset = queryset.with_stats()
+        return queryset
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Stream the JSON body one tour at a time.
+
+        The project fields are serialized up front; each prefetched tour is then
+        serialized and encoded only when the client is ready for it, so the full
+        payload is never held in memory at once. The browsable API falls back to
+        the regular response.
+        """
+        if not isinstance(request.accepted_renderer, ORJSONRenderer):
+            return super().retrieve(request, *args, **kwargs)
+
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        # Keep "tours" where the serializer puts it, so both renderers return the same object
+        position = list(serializer.fields).index('tours')
+        tour_serializer = serializer.fields.pop('tours').child
+        data = serializer.data
+        # get_object() already ran the prefetches; the list makes sure no query is
+        # left for the stream, where a failure could no longer become an error response
+        tours = list(instance.tours.all())
+        tour_items = (tour_serializer.to_representation(tour) for tour in tours)
+
+        return StreamingHttpResponse(
+            stream_object_with_list(data, 'tours', tour_items, position),
+            content_type=ORJSONRenderer.media_type,
         )
 
 @extend_schema(
@@ -415,25 +452,24 @@ class ProjectMembersView(generics.GenericAPIView):
 
     def get(self, request, pk):
         """Get list of members for the specified project"""
-        user_groups = request.user.groups.all()
-
         try:
-            project = Project.objects.filter(  # type: ignore[attr-defined]
+            # Only the project's group id is needed; don't load the project or group rows
+            group_id = Project.objects.filter(  # type: ignore[attr-defined]
                 pk=pk,
-                group__in=user_groups
-            ).select_related('group').first()
+                group_id__in=get_user_group_ids(request)
+            ).values_list('group_id', flat=True).first()
 
-            if not project:
+            if group_id is None:
                 return Response(
                     {'detail': 'Not found.'},
                     status=status.HTTP_404_NOT_FOUND
                 )
 
-            # Get all members of the project's group
-            members = project.group.user_set.all().order_by('username')
-            serializer = UserLiteSerializer(members, many=True)
+            # UserLiteSerializer only exposes plain columns, so read them as dicts
+            # instead of building and serializing a User instance per member
+            members = User.objects.filter(groups=group_id).order_by('username').values(*UserLiteSerializer.Meta.fields)
 
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(list(members), status=status.HTTP_200_OK)
 
         except Exception as e:
             return Response(
@@ -465,8 +501,7 @@ class ProjectMemberAddView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, pk):
-        user_groups = request.user.groups.all()
-        project = Project.objects.filter(pk=pk, group__in=user_groups).select_related('group').first()  # type: ignore[attr-defined]
+        project = Project.objects.filter(pk=pk, group_id__in=get_user_group_ids(request)).select_related('group').first()  # type: ignore[attr-defined]
         if not project:
             return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -504,8 +539,7 @@ class ProjectMemberRemoveView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, pk):
-        user_groups = request.user.groups.all()
-        project = Project.objects.filter(pk=pk, group__in=user_groups).select_related('group').first()  # type: ignore[attr-defined]
+        project = Project.objects.filter(pk=pk, group_id__in=get_user_group_ids(request)).select_related('group').first()  # type: ignore[attr-defined]
         if not project:
             return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -1,13 +1,14 @@
 from rest_framework import generics, permissions
 from rest_framework.throttling import ScopedRateThrottle
-from django.db.models import Count, Prefetch, Q
-from math import radians, cos, sin, asin, sqrt
+from django.db.models import Prefetch
 from ..models.project import Project
 from ..models.tour import Tour
+from ..pagination import OptionalLimitOffsetPagination
 from ..serializers.project_serializer import ProjectSerializerLite
 from ..serializers.nested_serializers import ProjectPopulatedSerializer
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 from .mixins import LocaleContextMixin, POIPrefetchMixin
+from .mixins.queryset import POPULATED_TOUR_FIELDS
 
 
 @extend_schema(
@@ -39,6 +40,8 @@ from .mixins import LocaleContextMixin, POIPrefetchMixin
             required=False,
             type=OpenApiTypes.FLOAT
         ),
+        OpenApiParameter(name='limit', description='Maximum number of projects to return (max 500). When provided, the response is paginated.', required=False, type=int),
+        OpenApiParameter(name='offset', description='Number of projects to skip before returning results. Used together with limit.', required=False, type=int),
     ],
     responses={
         200: ProjectSerializerLite(many=True)
@@ -52,7 +55,8 @@ class PublicProjectListView(LocaleContextMixin, generics.ListAPIView):
     without nested tours array for performance.
 
     Supports proximity-based ordering when order_by=proximity parameter is provided
-    along with lat and long coordinates.
+    along with lat and long coordinates. Pass limit/offset to page through the
+    results; the page is sliced in SQL after ordering, including by proximity.
 
     Anonymous users can access this endpoint with throttling limits.
     """
@@ -60,25 +64,7 @@ class PublicProjectListView(LocaleContextMixin, generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
     throttle_classes = [ScopedRateThrottle]
     throttle_scope = 'public_projects'
-
-    def haversine_distance(self, lat1, lon1, lat2, lon2):
-        """
-        Calculate the great circle distance in kilometers between two points
-        on the earth (specified in decimal degrees) using the Haversine formula.
-        """
-        # Convert decimal degrees to radians
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-        c = 2 * asin(sqrt(a))
-
-        # Radius of earth in kilometers
-        r = 6371
-
-        return c * r
+    pagination_class = OptionalLimitOffsetPagination
 
     def get_queryset(self):
         """
@@ -86,14 +72,9 @@ class PublicProjectListView(LocaleContextMixin, generics.ListAPIView):
         Annotates with counts of public tours and their POIs.
         If order_by=proximity with lat and long parameters, order by distance to given coordinates.
         """
-        # Filter projects that have at least one public tour
-        # Use Q filter to only count public tours and their POIs
-        queryset = Project.objects.filter(  # type: ignore[attr-defined]
-            tours__is_public=True
-        ).distinct().annotate(
-            total_tours=Count('tours', filter=Q(tours__is_public=True), distinct=True),
-            total_pois=Count('tours__pois', filter=Q(tours__is_public=True), distinct=True)
-        )
+        # Filter projects that have at least one public tour and count only
+        # public tours and their POIs
+        queryset = Project.objects.with_public_tours().with_stats(public_only=True).with_center()  # type: ignore[attr-defined]
 
         # Check if proximity ordering is requested
         order_by = self.request.query_params.get('order_by', None)
@@ -109,29 +90,9 @@ class PublicProjectListView(LocaleContextMixin, generics.ListAPIView):
                     user_lat = float(user_lat)
                     user_long = float(user_long)
 
-                    # Fetch all projects with prefetched tours to avoid N+1 queries
-                    projects = list(queryset.prefetch_related('tours'))
-
-                    # Calculate distance for each project and attach it
-                    for project in projects:
-                        # Get project center using only public tours
-                        center = project.get_center(public_only=True)
-
-                        if center:
-                            project_lat = center['lat']
-                            project_long = center['long']
-                            project._distance = self.haversine_distance(
-                                user_lat, user_long, project_lat, project_long
-                            )
-                        else:
-                            # No valid center, put at the end
-                            project._distance = float('inf')
-
-                    # Sort projects by distance
-                    projects.sort(key=lambda p: p._distance)
-
-                    # Return as a list (Django will handle it properly)
-                    return projects
+                    # Distances are computed and sorted in the database from the
+                    # public tour centers, so the result stays a paginatable queryset
+                    return queryset.order_by_distance(user_lat, user_long)
 
             except (ValueError, TypeError):
                 # If lat/long conversion fails, skip proximity ordering
@@ -184,12 +145,9 @@ class PublicProjectPopulatedView(POIPrefetchMixin, LocaleContextMixin, generics.
         Returns all projects with ONLY public tours.
         """
         # Build tour queryset - only public tours for public endpoint
-        tour_queryset = Tour.objects.filter(is_public=True).prefetch_related(
-            self.get_poi_prefetch()
-        ).annotate(  # type: ignore[attr-defined]
-            total_pois=Count('pois', distinct=True),
-            total_assets=Count('pois__assets', distinct=True)
-        )
+        tour_queryset = Tour.objects.filter(is_public=True).only(*POPULATED_TOUR_FIELDS).prefetch_related(  # type: ignore[attr-defined]
+            self.get_populated_poi_prefetch()
+        ).with_stats()
 
         # Create optimized prefetch for tours with POIs
         tour_prefetch = Prefetch(
@@ -201,7 +159,4 @@ class PublicProjectPopulatedView(POIPrefetchMixin, LocaleContextMixin, generics.
         return Project.objects.prefetch_related(  # type: ignore[attr-defined]
             tour_prefetch,
             'group__user_set'
-        ).annotate(
-            total_tours=Count('tours', filter=Q(tours__is_public=True), distinct=True),
-            total_pois=Count('tours__pois', filter=Q(tours__is_public=True), distinct=True)
-        )
+        ).with_stats(public_only=True)
@@ -1,17 +1,28 @@
+from collections import defaultdict
+
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.db.models import Count
+from rest_framework.renderers import BrowsableAPIRenderer
+from django.db import transaction
+from django.db.models import Case, Count, Exists, F, JSONField, Max, OuterRef, Subquery, Value, When
+from django.db.models.fields.json import KeyTransform
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from ..models.tour import Tour
 from ..models.project import Project
 from ..models.poi import POI
+from ..models.poi_asset import POIAsset
 from ..serializers.tour_serializer import TourSerializer
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 from rest_framework.exceptions import PermissionDenied
 from django.core.exceptions import ObjectDoesNotExist
 from django.shortcuts import get_object_or_404
-from ..permissions import IsGroupMember
-from .mixins import LocaleContextMixin, POIPrefetchMixin
+from django.http import StreamingHttpResponse
+from ..permissions import InProjectGroup, IsGroupMember, get_user_group_ids
+from ..prefetch import prefetch_empty
+from ..renderers import ORJSONRenderer, stream_object_with_list
+from .mixins import LocaleContextMixin, POIPrefetchMixin, ConditionalGetMixin
 
 @extend_schema(
     methods=['GET'],
@@ -84,36 +95,23 @@ from .mixins import LocaleContextMixin, POIPrefetchMixin
 )
 class TourListCreateView(POIPrefetchMixin, LocaleContextMixin, generics.ListCreateAPIView):
     serializer_class = TourSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [InProjectGroup]
 
     def get_queryset(self):
-        user = self.request.user
-        user_groups = user.groups.all()
+        group_ids = get_user_group_ids(self.request)
+        # Annotate with counts and prefetch POIs for better performance; poi_counter
+        # is the only column the serializer never reads
+        tours = self.get_tour_queryset().defer('poi_counter')
+
+        # Only tours from user's groups; the group check is part of the same query,
+        # so filtering by a project needs no separate project lookup
+        tours = tours.filter(project__group_id__in=group_ids)
 
         # Filter by project if specified
         project_id = self.request.query_params.get('project_id')
         if project_id:
-            try:
-                project = Project.objects.get(pk=project_id)  # type: ignore[attr-defined]
-                if project.group not in user_groups:
-                    return Tour.objects.none()  # type: ignore[attr-defined]
-                # Annotate with counts and prefetch POIs for better performance
-                return Tour.objects.filter(project=project).prefetch_related(  # type: ignore[attr-defined]
-                    self.get_poi_prefetch()
-                ).annotate(
-                    total_pois=Count('pois', distinct=True),
-                    total_assets=Count('pois__assets', distinct=True)
-                )
-            except ObjectDoesNotExist:
-                return Tour.objects.none()  # type: ignore[attr-defined]
-
-        # Return all tours from user's groups with prefetch and annotations
-        return Tour.objects.filter(project__group__in=user_groups).prefetch_related(  # type: ignore[attr-defined]
-            self.get_poi_prefetch()
-        ).annotate(
-            total_pois=Count('pois', distinct=True),
-            total_assets=Count('pois__assets', distinct=True)
-        )
+            tours = tours.filter(project_id=project_id)
+        return tours
 
     def perform_create(self, serializer):
         project_id = self.request.data.get('project_id')
@@ -125,8 +123,7 @@ class TourListCreateView(POIPrefetchMixin, LocaleContextMixin, generics.ListCrea
         except ObjectDoesNotExist:
             raise PermissionDenied('Project not found.')
 
-        user = self.request.user
-        if project.group not in user.groups.all():
+        if project.group_id not in get_user_group_ids(self.request):
             raise PermissionDenied('Not a member of the project group.')
 
         serializer.save(project=project)
@@ -137,8 +134,12 @@ class TourListCreateView(POIPrefetchMixin, LocaleContextMixin, generics.ListCrea
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
 
-        # Refetch the created instance directly, since permission was already checked
-        instance = Tour.objects.get(pk=serializer.instance.pk)
+        # A freshly created tour has no POIs, so attach the empty prefetch and stats
+        # directly instead of refetching the row
+        instance = serializer.instance
+        prefetch_empty(instance, 'pois')
+        instance.total_pois = 0
+        instance.total_assets = 0
         serializer = self.get_serializer(instance)
 
         headers = self.get_success_headers(serializer.data)
@@ -208,29 +209,26 @@ class TourRetrieveUpdateView(POIPrefetchMixin, LocaleContextMixin, generics.Retr
     permission_classes = [permissions.IsAuthenticated, IsGroupMember]
 
     def get_queryset(self):
-        # Annotate with counts and prefetch POIs for better performance
-        return Tour.objects.all().prefetch_related(  # type: ignore[attr-defined]
-            self.get_poi_prefetch()
-        ).annotate(
-            total_pois=Count('pois', distinct=True),
-            total_assets=Count('pois__assets', distinct=True)
-        )
+        # Annotate with counts and prefetch POIs for better performance; the project
+        # is joined in for the IsGroupMember check
+        return self.get_tour_detail_queryset()
 
     def delete(self, request, pk):
-        user = request.user
-        user_groups = user.groups.all()
         try:
-            tour = Tour.objects.get(pk=pk, project__group__in=user_groups)  # type: ignore[attr-defined]
+            # Fetch the tour and whether it has POIs in one query
+            tour = Tour.objects.annotate(  # type: ignore[attr-defined]
+                has_pois=Exists(POI.objects.filter(tour=OuterRef('pk')))  # type: ignore[attr-defined]
+            ).get(pk=pk, project__group_id__in=get_user_group_ids(request))
         except ObjectDoesNotExist:
             return Response({'detail': 'Tour not found.'}, status=status.HTTP_404_NOT_FOUND)
         if tour.is_public:
             return Response({'detail': 'Cannot delete a public tour.'}, status=status.HTTP_400_BAD_REQUEST)
-        if POI.objects.filter(tour=tour).exists():  # type: ignore[attr-defined]
+        if tour.has_pois:
             return Response({'detail': 'Cannot delete a tour with POIs.'}, status=status.HTTP_400_BAD_REQUEST)
         tour.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-class SetTourPublicStatusView(LocaleContextMixin, APIView):
+class SetTourPublicStatusView(POIPrefetchMixin, LocaleContextMixin, APIView):
     """Base view for changing tour publication status."""
     serializer_class = TourSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -238,29 +236,26 @@ class SetTourPublicStatusView(LocaleContextMixin, APIView):
     action_name = None  # To be set by subclasses
     
     def post(self, request, pk):
-        user = request.user
-        user_groups = user.groups.all()
-        
-        try:
-            tour = Tour.objects.get(pk=pk)  # type: ignore[attr-defined]
-        except Tour.DoesNotExist:
-            return Response(
-                {'detail': 'Tour not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        # Check permission: user must be a member of the project's group
-        if not tour.project.group in user_groups:
-            return Response(
-                {'detail': 'You do not have permission to publish this tour.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
-        # Set tour publication status
-        tour.is_public = self.is_public
-        tour.save()
-        
+        with transaction.atomic():
+            # Set tour publication status with one UPDATE scoped to the user's groups
+            updated = Tour.objects.filter(  # type: ignore[attr-defined]
+                pk=pk, project__group_id__in=get_user_group_ids(request)
+            ).update(is_public=self.is_public, updated_at=timezone.now())
+            if not updated:
+                if Tour.objects.filter(pk=pk).exists():  # type: ignore[attr-defined]
+                    return Response(
+                        {'detail': 'You do not have permission to publish this tour.'},
+                        status=status.HTTP_403_FORBIDDEN
+                    )
+                return Response(
+                    {'detail': 'Tour not found.'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            # update() skips the post_save signal, so refresh the project's public center here
+            Project.objects.filter(tours=pk).refresh_public_center()  # type: ignore[attr-defined]
+
         # Return updated tour data
+        tour = self.get_tour_detail_queryset().get(pk=pk)
         context = {'request': request}
         locale = request.query_params.get('locale')
         if locale:
@@ -334,6 +329,55 @@ class UnpublishTourView(SetTourPublicStatusView):
     is_public = False
     action_name = 'unpublish'
 
+# Rows fetched per round trip when reading a published tour's assets
+ASSET_CHUNK_SIZE = 500
+
+def _multilingual(field, locale, json=False):
+    """
+    Expression selecting a multilingual JSON field. When a locale is requested the
+    database projects values with a 'locales' key to that locale's value (falling
+    back to 'en', then to '' or [] for json=True fields), so only one translation
+    is read. Anything else (NULL, {}) comes back unchanged, as the serializer fields do.
+    """
+    if not locale:
+        return F(field)
+    locales = KeyTransform('locales', field)
+    default = Value([] if json else '', output_field=JSONField())
+    return Case(
+        When(
+            **{f'{field}__has_key': 'locales'},
+            then=Coalesce(KeyTransform(locale, locales), KeyTransform('en', locales), default),
+        ),
+        default=F(field),
+        output_field=JSONField(),
+    )
+
+def _localize_linked_asset(linked_asset, locale):
+    """
+    Project a linked asset to the title and url strings for the locale, falling
+    back to 'en' and then ''. Empty or malformed values are returned unchanged.
+
+    Input structure:
+    {
+        "title": {"locales": {"en": "...", "el": "..."}},
+        "url": {"locales": {"en": "...", "el": "..."}}
+    }
+
+    Output:
+    {
+        "title": "...",
+        "url": "..."
+    }
+    """
+    if not linked_asset or not isinstance(linked_asset, dict):
+        return linked_asset
+    result = {}
+    for field in ('title', 'url'):
+        value = linked_asset.get(field)
+        locales = value.get('locales', {}) if isinstance(value, dict) else {}
+        result[field] = locales.get(locale, locales.get('en', ''))
+    return result
+
 @extend_schema(
     description="Retrieve a published tour with all its associated data (POIs, assets, etc.) as a single JSON response.",
     summary="Get Published Tour",
@@ -424,7 +468,7 @@ class UnpublishTourView(SetTourPublicStatusView):
         )
     }
 )
-class PublishedTourView(generics.RetrieveAPIView):
+class PublishedTourView(ConditionalGetMixin, generics.RetrieveAPIView):
     """
     Retrieve a published tour with all its associated data as a single JSON response.
     GET /api/publishedTour/{id}/
@@ -432,106 +476,119 @@ class PublishedTourView(generics.RetrieveAPIView):
     Supports locale filtering: pass a 'locale' query parameter to get just the string
     for that locale instead of the full multilingual object.
     """
-    queryset = Tour.objects.all()
     permission_classes = []  # No authentication required for published tours
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
-    def _filter_multilingual_field(self, field_value, locale):
-        """
-        Helper to filter multilingual field based on locale.
-        Returns the string for the locale if locale is provided, otherwise the full object.
-        Falls back to 'en' if the requested locale doesn't exist.
-        """
-        if locale and isinstance(field_value, dict) and 'locales' in field_value:
-            locales = field_value['locales']
-            return locales.get(locale, locales.get('en', ''))
-        return field_value
-
-    def _filter_external_links(self, links_value, locale):
+    def get_queryset(self):
         """
-        Helper to filter external links based on locale.
-        Returns the array for the locale if locale is provided, otherwise the full object.
-        Falls back to 'en' if the requested locale doesn't exist.
+        Load only the columns the payload reads (the multilingual ones projected
+        to the requested locale), plus the version of the tour's POIs and assets
+        (row counts and latest updated_at) for the ETag, all in the same query.
         """
-        if locale and isinstance(links_value, dict) and 'locales' in links_value:
-            locales = links_value['locales']
-            return locales.get(locale, locales.get('en', []))
-        return links_value
-
-    def _filter_linked_asset(self, linked_asset_value, locale):
-        """
-        Helper to filter linked asset based on locale.
-        Returns the title and url strings for the locale if locale is provided, otherwise the full object.
-        Falls back to 'en' if the requested locale doesn't exist.
-
-        Input structure:
-        {
-            "title": {"locales": {"en": "...", "el": "..."}},
-            "url": {"locales": {"en": "...", "el": "..."}}
-        }
-
-        Output when locale is provided:
-        {
-            "title": "...",
-            "url": "..."
-        }
-        """
-        if not linked_asset_value or not isinstance(linked_asset_value, dict):
-            return linked_asset_value
-
-        if locale:
-            result = {}
-            for field in ['title', 'url']:
-                if field in linked_asset_value and isinstance(linked_asset_value[field], dict):
-                    locales = linked_asset_value[field].get('locales', {})
-                    result[field] = locales.get(locale, locales.get('en', ''))
-                else:
-                    result[field] = ''
-            return result
-
-        return linked_asset_value
+        locale = self.request.query_params.get('locale')
+        pois = POI.objects.filter(tour=OuterRef('pk')).order_by().values('tour')  # type: ignore[attr-defined]
+        assets = POIAsset.objects.filter(poi__tour=OuterRef('pk')).order_by().values('poi__tour')  # type: ignore[attr-defined]
+        return Tour.objects.only(  # type: ignore[attr-defined]
+            'id', 'is_public', 'bounding_box', 'distance_meters', 'duration_minutes', 'locales', 'guided', 'updated_at'
+        ).annotate(
+            localized_title=_multilingual('title', locale),
+            localized_description=_multilingual('description', locale),
+            poi_total=Subquery(pois.annotate(n=Count('pk')).values('n')),
+            poi_modified=Subquery(pois.annotate(m=Max('updated_at')).values('m')),
+            asset_total=Subquery(assets.annotate(n=Count('pk')).values('n')),
+            asset_modified=Subquery(assets.annotate(m=Max('updated_at')).values('m')),
+        )
 
     def retrieve(self, request, *args, **kwargs):
         tour = self.get_object()
         locale = request.query_params.get('locale')
 
+        # Answer revalidations from the version columns before reading any POI rows.
+        # Only the ETag is sent: a delete lowers a count but never raises MAX(updated_at),
+        # so a Last-Modified validator would answer If-Modified-Since with a stale 304
+        last_modified = max(
+            modified for modified in (tour.updated_at, tour.poi_modified, tour.asset_modified) if modified
+        )
+        etag = self.build_etag(
+            tour.pk, tour.poi_total or 0, tour.asset_total or 0, last_modified.timestamp(), locale or ''
+        )
+        not_modified = self.get_not_modified_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
         # Build the complete tour data structure
         tour_data = {
             'id': tour.id,
-            'title': self._filter_multilingual_field(tour.title, locale),
-            'description': self._filter_multilingual_field(tour.description, locale),
+            'title': tour.localized_title,
+            'description': tour.localized_description,
             'is_public': tour.is_public,
             'bounding_box': tour.bounding_box,
             'distance_meters': tour.distance_meters,
             'duration_minutes': tour.duration_minutes,
             'locales': tour.locales,
             'guided': tour.guided,
-            'pois': [],
         }
-        # Add POIs with their POI assets
-        for poi in tour.pois.all().order_by('order'):
-            poi_data = {
-                'id': poi.id,
-                'title': self._filter_multilingual_field(poi.title, locale),
-                'description': self._filter_multilingual_field(poi.description, locale),
-                'coordinates': poi.coordinates,
-                'radius': poi.radius,
-                'external_links': self._filter_external_links(poi.external_links, locale),
-                'order': poi.order,
-                'assets': []
+        # Read the POIs and their assets as plain rows (one query each, no model
+        # instances), with the multilingual fields already projected to the locale,
+        # and attach each asset to its POI in a single pass
+        pois = POI.objects.filter(tour=tour).order_by('order').values(  # type: ignore[attr-defined]
+            'id', 'coordinates', 'radius', 'order',
+            localized_title=_multilingual('title', locale),
+            localized_description=_multilingual('description', locale),
+            localized_external_links=_multilingual('external_links', locale, json=True),
+        )
+        assets = POIAsset.objects.filter(poi__tour=tour).order_by('id').values(  # type: ignore[attr-defined]
+            'id', 'poi_id', 'type', 'priority', 'view_in_ar', 'georeference', 'linked_asset',
+            localized_title=_multilingual('title', locale),
+            localized_description=_multilingual('description', locale),
+            localized_url=_multilingual('url', locale),
+        )
+        # Only a requested locale changes linked_asset, so decide that once rather than per asset
+        if locale:
+            def localize_linked_asset(value):
+                return _localize_linked_asset(value, locale)
+        else:
+            def localize_linked_asset(value):
+                return value
+        assets_by_poi = defaultdict(list)
+        # Read the asset rows in chunks so only the grouped payload dicts stay in
+        # memory, not a second full list of raw rows in the queryset cache
+        for asset in assets.iterator(chunk_size=ASSET_CHUNK_SIZE):
+            assets_by_poi[asset['poi_id']].append({
+                'id': asset['id'],
+                'type': asset['type'],
+                'title': asset['localized_title'],
+                'description': asset['localized_description'],
+                'url': asset['localized_url'],
+                'priority': asset['priority'],
+                'view_in_ar': asset['view_in_ar'],
+                'georeference': asset['georeference'],
+                'linked_asset': localize_linked_asset(asset['linked_asset'])
+            })
+        # Build every POI before responding: a database error must surface as an error
+        # response, not as a truncated body after streaming has started
+        poi_items = [
+            {
+                'id': poi['id'],
+                'title': poi['localized_title'],
+                'description': poi['localized_description'],
+                'coordinates': poi['coordinates'],
+                'radius': poi['radius'],
+                'external_links': poi['localized_external_links'],
+                'order': poi['order'],
+                'assets': assets_by_poi[poi['id']]
             }
-            # Add POI assets associated with this POI
-            for asset in poi.assets.all():
-                asset_data = {
-                    'id': asset.id,
-                    'type': asset.type,
-                    'title': self._filter_multilingual_field(asset.title, locale),
-                    'description': self._filter_multilingual_field(asset.description, locale),
-                    'url': self._filter_multilingual_field(asset.url, locale),
-                    'priority': asset.priority,
-                    'view_in_ar': asset.view_in_ar,
-                    'georeference': asset.georeference,
-                    'linked_asset': self._filter_linked_asset(asset.linked_asset, locale)
-                }
-                poi_data['assets'].append(asset_data)
-            tour_data['pois'].append(poi_data)
-        return Response(tour_data)
\ No newline at end of file
+            for poi in pois
+        ]
+
+        if not isinstance(request.accepted_renderer, ORJSONRenderer):
+            tour_data['pois'] = poi_items
+            return self.set_conditional_headers(Response(tour_data), etag=etag)
+
+        # Encode the body one POI at a time so the whole JSON document is never held in memory
+        response = StreamingHttpResponse(
+            stream_object_with_list(tour_data, 'pois', poi_items),
+            content_type=ORJSONRenderer.media_type,
+        )
+        return self.set_conditional_headers(response, etag=etag)
+
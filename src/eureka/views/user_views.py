@@ -1,25 +1,57 @@
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
 from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ValidationError
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 from django.contrib.auth import authenticate, login
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 import requests
 
 from ..models.user import User
+from ..pagination import OptionalLimitOffsetPagination
+from ..renderers import ORJSONRenderer
 from ..serializers import UserSerializer, LoginSerializer, SignupSerializer, CurrentUserSerializer
+from ..throttles import FailedLoginThrottle
+
+# Body of every error response in this module, shared by the schema declarations below
+ERROR_RESPONSE_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'error': {'type': 'string', 'description': 'Error message'}
+    },
+    'required': ['error']
+}
 
 @extend_schema(
-    description="Retrieve a list of all active and inactive users in the system.",
+    description="Retrieve a list of all active and inactive users in the system. Pass limit/offset to page through the users.",
     summary="List all Users",
-    tags=['User'] 
+    tags=['User'],
+    parameters=[
+        OpenApiParameter(name='limit', description='Maximum number of users to return (max 500). When provided, the response is paginated.', required=False, type=int),
+        OpenApiParameter(name='offset', description='Number of users to skip before returning results. Used together with limit.', required=False, type=int),
+    ]
 )
 class UserListView(generics.ListAPIView):
-    queryset = User.objects.all()
+    queryset = User.objects.order_by('id')  # Stable order for pagination
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated] # Ensures only logged-in users can list
+    pagination_class = OptionalLimitOffsetPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
+    def list(self, request, *args, **kwargs):
+        # UserSerializer only copies scalar columns, so read exactly those as plain
+        # rows and skip building model instances and per-field serialization
+        users = self.get_queryset().values(*UserSerializer.Meta.fields)
+        page = self.paginate_queryset(users)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(users))
 
 
 # --- New API Views for Authentication ---
@@ -48,13 +80,7 @@ class UserListView(generics.ListAPIView):
         ),
         401: OpenApiResponse(
             description="Invalid credentials",
-            response={
-                'type': 'object',
-                'properties': {
-                    'error': {'type': 'string', 'description': 'Error message'}
-                },
-                'required': ['error']
-            },
+            response=ERROR_RESPONSE_SCHEMA,
             examples=[
                 OpenApiExample(
                     'Invalid Credentials',
@@ -71,10 +97,15 @@ class UserListView(generics.ListAPIView):
 )
 class LoginView(APIView):
     permission_classes = []
+    # Bound password-guessing load: rejected attempts cost a cache lookup, not a hash
+    throttle_classes = [FailedLoginThrottle]
 
     def post(self, request, *args, **kwargs):
         serializer = LoginSerializer(data=request.data, context={'request': request})
-        serializer.is_valid(raise_exception=True)
+        if not serializer.is_valid():
+            # Only rejected credentials count towards the per-login throttle
+            FailedLoginThrottle().record_failure(request, self)
+            raise ValidationError(serializer.errors)
         user = serializer.validated_data['user']
 
         if not user.is_active:
@@ -116,13 +147,7 @@ class LoginView(APIView):
         ),
         400: OpenApiResponse(
             description="Invalid request data",
-            response={
-                'type': 'object',
-                'properties': {
-                    'error': {'type': 'string', 'description': 'Error message'}
-                },
-                'required': ['error']
-            },
+            response=ERROR_RESPONSE_SCHEMA,
             examples=[
                 OpenApiExample(
                     'Invalid Request (Passwords)',
@@ -134,13 +159,7 @@ class LoginView(APIView):
         ),
         409: OpenApiResponse(
             description="Email already in use",
-            response={
-                'type': 'object',
-                'properties': {
-                    'error': {'type': 'string', 'description': 'Error message'}
-                },
-                'required': ['error']
-            },
+            response=ERROR_RESPONSE_SCHEMA,
             examples=[
                 OpenApiExample(
                     'Email Already In Use',
@@ -161,8 +180,11 @@ class SignupView(generics.CreateAPIView):
     permission_classes = []
 
     def perform_create(self, serializer):
-        user = serializer.save()
-        token, created = Token.objects.get_or_create(user=user)
+        # The user was just inserted and cannot have a token yet, so create it
+        # directly; both rows commit together or not at all
+        with transaction.atomic():
+            user = serializer.save()
+            token = Token.objects.create(user=user)
         self.headers = self.get_success_headers(serializer.data)
         self.response_data = {
             'message': 'Signup successful',
@@ -182,13 +204,7 @@ class SignupView(generics.CreateAPIView):
         200: CurrentUserSerializer,
         401: OpenApiResponse(
             description="Unauthorized access",
-            response={
-                'type': 'object',
-                'properties': {
-                    'error': {'type': 'string', 'description': 'Error message'}
-                },
-                'required': ['error']
-            },
+            response=ERROR_RESPONSE_SCHEMA,
             examples=[
                 OpenApiExample(
                     'Unauthorized Access',
@@ -211,16 +227,10 @@ class CurrentUserView(generics.RetrieveUpdateAPIView):
         return self.request.user
 
     def retrieve(self, request, *args, **kwargs):
-        if not request.user.is_authenticated:
-            return Response({"error": "Unauthorized access."}, status=status.HTTP_401_UNAUTHORIZED)
-            
+        # IsAuthenticated has already rejected anonymous requests before this runs
+
         # OIDC Introspection Check
         # The frontend hits this endpoint every 5 minutes. We check if they have an active EGI token.
-        from django.core.cache import cache
-        from rest_framework.authtoken.models import Token
-        import requests
-        from django.conf import settings
-        
         # We need the Token object to get the key used in the cache
         auth_header = request.META.get('HTTP_AUTHORIZATION', '')
         if auth_header.startswith('Token '):
@@ -295,13 +305,7 @@ class CurrentUserView(generics.RetrieveUpdateAPIView):
         ),
         400: OpenApiResponse(
             description="Invalid request or failed token exchange",
-            response={
-                'type': 'object',
-                'properties': {
-                    'error': {'type': 'string', 'description': 'Error message'}
-                },
-                'required': ['error']
-            },
+            response=ERROR_RESPONSE_SCHEMA,
             examples=[
                 OpenApiExample(
                     'Missing Code',
@@ -313,13 +317,7 @@ class CurrentUserView(generics.RetrieveUpdateAPIView):
         ),
         401: OpenApiResponse(
             description="Authentication failed",
-            response={
-                'type': 'object',
-                'properties': {
-                    'error': {'type': 'string', 'description': 'Error message'}
-                },
-                'required': ['error']
-            },
+            response=ERROR_RESPONSE_SCHEMA,
             examples=[
                 OpenApiExample(
                     'Invalid Token',
@@ -344,6 +342,8 @@ class OIDCLoginView(APIView):
     and returns a Django token for API access.
     """
     permission_classes = []
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'login'
 
     def post(self, request, *args, **kwargs):
         code = request.data.get('code')
@@ -470,16 +470,12 @@ class OIDCLoginView(APIView):
 
         # Cache the external EGI access token for introspection, tying it to the local DRF token.
         # Check-In tokens usually expire in 1 hour. We cache it so the /me endpoint can use it.
-        from django.core.cache import cache
         cache.set(f"egi_token_{token.key}", access_token, timeout=3600)
 
-        # Serialize user data
-        user_serializer = CurrentUserSerializer(user)
-
         return Response({
             'token': token.key,
             'user_id': str(user.id),
-            'user': user_serializer.data
+            'user': CurrentUserSerializer(user, context={'request': request}).data
         }, status=status.HTTP_200_OK)
 
 
@@ -505,13 +501,7 @@ class OIDCLoginView(APIView):
         ),
         401: OpenApiResponse(
             description="Unauthorized access",
-            response={
-                'type': 'object',
-                'properties': {
-                    'error': {'type': 'string', 'description': 'Error message'}
-                },
-                'required': ['error']
-            },
+            response=ERROR_RESPONSE_SCHEMA,
             examples=[
                 OpenApiExample(
                     'Unauthorized Access',
@@ -7,7 +7,7 @@ in the API documentation for all models (Project, Tour, POI, Asset).
 import os
 import sys
 import django
-import json
+from functools import lru_cache
 
 # Add the project root to the Python path
 sys.path.insert(0, '/app')
@@ -20,74 +20,51 @@ from drf_spectacular.generators import SchemaGenerator
 from drf_spectacular.settings import spectacular_settings
 from eureka.urls import urlpatterns
 
+@lru_cache(maxsize=1)
+def _get_schema():
+    """Generate the API schema once per process; every check reads the same result."""
+    return SchemaGenerator().get_schema(request=None, public=True)
+
+# Multilingual fields expected to reference the MultilingualText component, per schema
+EXPECTED_MULTILINGUAL_FIELDS = {
+    'Project': ('title', 'description'),
+    'Tour': ('title', 'description'),
+    'POI': ('title', 'description'),
+    'Asset': ('title', 'description'),
+}
+MULTILINGUAL_REF = '#/components/schemas/MultilingualText'
+
+def _ref_of(prop):
+    """Return the component a property references, looking through the allOf wrapper added for nullable/documented fields."""
+    if '$ref' in prop:
+        return prop['$ref']
+    return next((part.get('$ref') for part in prop.get('allOf', ()) if '$ref' in part), None)
+
 def test_multilingual_text_schema():
     """Test that MultilingualText schema appears in the API documentation."""
-    
-    # Generate the schema
-    generator = SchemaGenerator()
-    schema = generator.get_schema(request=None, public=True)
-    
-    # Check if MultilingualText schema is defined
-    if 'components' in schema and 'schemas' in schema['components']:
-        schemas = schema['components']['schemas']
-        
-        if 'MultilingualText' in schemas:
-            print("✅ MultilingualText schema is properly defined!")
-            print(f"Schema definition: {json.dumps(schemas['MultilingualText'], indent=2)}")
-        else:
-            print("❌ MultilingualText schema is NOT found in the API schema!")
-            return False
-    
-    # Check if the schema is referenced in model serializers
-    model_schemas = ['Project', 'Tour', 'POI', 'Asset']
+    schemas = _get_schema()['components']['schemas']
+    assert 'MultilingualText' in schemas, "MultilingualText schema is NOT found in the API schema"
+
+    # Collect every missing or incorrect reference so one run reports them all
     missing_refs = []
-    
-    for model_name in model_schemas:
-        if model_name in schemas:
-            model_schema = schemas[model_name]
-            properties = model_schema.get('properties', {})
-            
-            # Check for multilingual fields
-            multilingual_fields = []
-            if model_name == 'Project':
-                multilingual_fields = ['title', 'description']
-            elif model_name == 'Tour':
-                multilingual_fields = ['title', 'description']
-            elif model_name == 'POI':
-                multilingual_fields = ['name', 'description']
-            elif model_name == 'Asset':
-                multilingual_fields = ['title', 'description']
-            
-            for field in multilingual_fields:
-                if field in properties:
-                    field_schema = properties[field]
-                    if '$ref' in field_schema and field_schema['$ref'] == '#/components/schemas/MultilingualText':
-                        print(f"✅ {model_name}.{field} properly references MultilingualText schema")
-                    else:
-                        print(f"❌ {model_name}.{field} does NOT reference MultilingualText schema")
-                        print(f"   Current schema: {json.dumps(field_schema, indent=2)}")
-                        missing_refs.append(f"{model_name}.{field}")
-                else:
-                    print(f"❌ {model_name}.{field} field not found in schema")
-                    missing_refs.append(f"{model_name}.{field}")
-        else:
-            print(f"❌ {model_name} schema not found in API documentation")
+    for model_name, multilingual_fields in EXPECTED_MULTILINGUAL_FIELDS.items():
+        if model_name not in schemas:
             missing_refs.append(model_name)
-    
-    if missing_refs:
-        print(f"\n❌ Missing or incorrect references: {missing_refs}")
-        return False
-    else:
-        print("\n✅ All MultilingualText references are properly configured!")
-        return True
+            continue
+        properties = schemas[model_name].get('properties', {})
+        missing_refs.extend(
+            f"{model_name}.{field}" for field in multilingual_fields
+            if _ref_of(properties.get(field, {})) != MULTILINGUAL_REF
+        )
+
+    assert not missing_refs, f"Missing or incorrect MultilingualText references: {missing_refs}"
 
 if __name__ == '__main__':
     print("Testing MultilingualText schema in API documentation...")
-    success = test_multilingual_text_schema()
-    
-    if success:
-        print("\n🎉 All tests passed! MultilingualText schema is properly configured.")
-        sys.exit(0)
-    else:
-        print("\n💥 Some tests failed. Please check the configuration.")
-        sys.exit(1) 
\ No newline at end of file
+    try:
+        test_multilingual_text_schema()
+    except AssertionError as error:
+        print(f"\n💥 {error}")
+        sys.exit(1)
+    print("\n🎉 All tests passed! MultilingualText schema is properly configured.")
+    sys.exit(0)